@@ -2,7 +2,7 @@
 from typing import Type, Dict
 from .field import Field
 from .constants import _DATACLASS_FIELDS_NAME, _T
-from .fast_dataclass import generate_fast_dataclass
+from .fast_dataclass import generate_fast_dataclass, _create_fn, _set_qualname
 
 
 def getter(cls: Type[_T]) -> Type[_T]:
@@ -16,9 +16,8 @@ def getter(cls: Type[_T]) -> Type[_T]:
 
 def generate_getter_func(field_name):
     """Generate getter function for class. 为类生成getter函数"""
-    def getter_func_wrapper(self):
-        return getattr(self, field_name)
-    return getter_func_wrapper
+    # 直接生成 `return self.xxx`，避免闭包单元与 getattr 调用
+    return _create_fn(f'get_{field_name}', ('self',), [f'return self.{field_name}'])
 
 
 def generate_getter(cls: Type[_T]) -> Type[_T]:
@@ -30,5 +29,5 @@ def generate_getter(cls: Type[_T]) -> Type[_T]:
 
     dataclass_fields: Dict[str, Field] = getattr(cls, _DATACLASS_FIELDS_NAME, {})
     for field_name, field in dataclass_fields.items():
-        setattr(cls, f'get_{field_name}', generate_getter_func(field_name))
+        setattr(cls, f'get_{field_name}', _set_qualname(cls, generate_getter_func(field_name)))
     return cls
\ No newline at end of file
@@ -21,6 +21,16 @@ class DefaultFactory:
 _DEFAULT_FACTORY = DefaultFactory()
 
 
+class MissingInput:
+    """未传入字段值的哨兵对象，给出易读的repr以便显示在生成的__init__签名中"""
+
+    def __repr__(self):
+        return 'MISSING'
+
+
+_MISSING_INPUT = MissingInput()
+
+
 class ArgsKwargs:
 
     def __init__(self, args: tuple[Any, ...], kwargs: dict[str, Any] | None = None):
@@ -111,4 +121,17 @@ class SerMode(enum.Enum):
     json = 'json'
 
     """到json字符串"""
-    string = 'string'
\ No newline at end of file
+    string = 'string'
+
+
+class ExtraMode(enum.IntEnum):
+    """额外字段处理方式，对应`DataclassConfig.extra`，以整数比较代替字符串比较"""
+
+    """允许任何额外的属性"""
+    allow = 0
+
+    """忽略任何额外的属性"""
+    ignore = 1
+
+    """禁止任何额外的属性"""
+    forbid = 2
@@ -1,10 +1,11 @@
 # -*- coding:utf-8 -*-
 import dataclasses
+from .constants import ExtraMode
 from .types import optional, ExtraValues
-from .globals import GlobalSetting
+from .globals import get_dataclass_default_required
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DataclassConfig:
     """快速数据类配置"""
 
@@ -65,4 +66,20 @@ class DataclassConfig:
 
     def __post_init__(self):
         if self.required is None:
-            self.required = GlobalSetting.get_dataclass_default_required()
\ No newline at end of file
+            self.required = get_dataclass_default_required()
+        # 创建时即校验，尽早发现无效的取值
+        _to_extra_mode(self.extra)
+
+    @property
+    def extra_mode(self) -> ExtraMode:
+        """由`extra`转换的枚举标记，供反序列化时比较；每次由`extra`得出，修改`extra`后随之变化"""
+        return _to_extra_mode(self.extra)
+
+
+def _to_extra_mode(extra: optional[ExtraValues]) -> ExtraMode:
+    if extra is None:
+        return ExtraMode.allow
+    try:
+        return ExtraMode[extra]
+    except (KeyError, TypeError):
+        raise ValueError(f"extra 应为 'allow'、'ignore' 或 'forbid'，而不是 {extra!r}") from None
\ No newline at end of file
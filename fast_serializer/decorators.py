@@ -4,7 +4,7 @@ from .field import Field
 from dataclasses import dataclass, field as dataclass_field
 
 
-@dataclass
+@dataclass(slots=True)
 class Decorator:
     """基础的装饰器信息"""
 
@@ -13,14 +13,14 @@ class Decorator:
     func: Callable[..., Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldValidatorDecoratorInfo(Decorator):
     """自定义字段验证装饰器"""
 
     fields: tuple[str, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class FastDataclassDecoratorInfo:
     """快速数据类装饰器信息"""
 
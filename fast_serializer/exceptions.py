@@ -1,5 +1,7 @@
 # -*- coding:utf-8 -*-
+import functools
 import json
+import sys
 from typing import (
     Any, List, Union, Optional
 )
@@ -7,10 +9,18 @@ from .types import optional
 from .utils import camel_to_snake, _format_type, isinstance_safe
 
 
+@functools.lru_cache(maxsize=256)
+def _exception_type_name(exception_class: type) -> str:
+    """按异常类缓存转换后的类型名，批量验证时同类异常只转换一次；驻留后比较与作为字典键时更快"""
+    return sys.intern(camel_to_snake(exception_class.__name__))
+
+
 def _format_exception_type(exception_type: Union[str, type]) -> str:
     if isinstance_safe(exception_type, str):
         return exception_type
-    return camel_to_snake(exception_type.__class__.__name__)
+    if not isinstance(exception_type, type):
+        exception_type = exception_type.__class__
+    return _exception_type_name(exception_type)
 
 
 class ErrorDetail:
@@ -46,12 +56,13 @@ class ErrorDetail:
         self.ctx = ctx
 
     def __str__(self):
-        return json.dumps(self.__dict__(), indent=4, ensure_ascii=False)
+        # 不缩进，可使用json的C编码器；不可序列化的输入值以repr输出
+        return json.dumps(self.to_dict(), ensure_ascii=False, default=repr)
 
     def __repr__(self):
         return self.__str__()
 
-    def __dict__(self):
+    def to_dict(self) -> dict:
         return {
             # 'key': self.key,
             'loc': self.loc,
@@ -77,8 +88,9 @@ class ValidationError(ValueError):
     def error_count(self) -> int:
         return len(self.line_errors)
 
-    def json(self) -> str:
-        return json.dumps(self.__dict__(), indent=4, ensure_ascii=False)
+    def json(self, indent: optional[int] = None) -> str:
+        """默认紧凑输出（可使用json的C编码器），需要易读格式时传入indent"""
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False, default=repr)
 
     def __str__(self):
         plural = 's' if len(self.line_errors) > 1 else ''
@@ -87,21 +99,27 @@ class ValidationError(ValueError):
     def __repr__(self):
         return self.__str__()
 
-    def __dict__(self):
-        return [error.__dict__() for error in self.line_errors]
+    def to_dict(self) -> List[dict]:
+        return [error.to_dict() for error in self.line_errors]
 
     def format_line_errors(self):
-        text = ""
-        length = len(self.line_errors)
-        for index, error in enumerate(self.line_errors):
-            enter_line = '' if index == length - 1 else '\n'
-            end_text = (f"["
-                        f"exception_type={error.exception_type}, "
-                        f"input_value={error.input_value!r}, "
-                        f"input_type={_format_type(error.input_value)}"
-                        f"]")
-            text += f"{'.'.join([str(e) for e in error.loc])}\n  {error.msg} {end_text}{enter_line}"
-        return text
+        # 先收集每条错误的文本再一次性拼接，避免循环中字符串反复拼接；
+        # 批量错误的输入值类型大多相同，类型名按类型缓存
+        type_names: dict = {}
+        lines: List[str] = []
+        for error in self.line_errors:
+            input_type = type(error.input_value)
+            type_name = type_names.get(input_type)
+            if type_name is None:
+                type_name = type_names[input_type] = _format_type(input_type)
+            lines.append(
+                f"{'.'.join(map(str, error.loc))}\n  {error.msg} ["
+                f"exception_type={error.exception_type}, "
+                f"input_value={error.input_value!r}, "
+                f"input_type={type_name}"
+                f"]"
+            )
+        return '\n'.join(lines)
 
 
 class DataclassCustomError(ValueError):
@@ -131,18 +149,12 @@ class DataclassCustomError(ValueError):
 
     @staticmethod
     def format_message(msg: str, context: optional[str]) -> str:
-        if not context:
+        # 没有占位符时无需替换
+        if not context or '{' not in msg:
             return msg
         message = msg
         for key, value in context.items():
-            placeholder = f"{{{key}}}"
-            if isinstance(value, str):
-                message = message.replace(placeholder, value)
-            elif isinstance(value, int):
-                message = message.replace(placeholder, str(value))
-            else:
-                # fallback for anything else just in case
-                message = message.replace(placeholder, str(value))
+            message = message.replace(f"{{{key}}}", str(value))
         return message
 
 
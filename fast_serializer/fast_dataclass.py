@@ -1,5 +1,6 @@
 # -*- coding:utf-8 -*-
-import builtins
+import copy
+import functools
 import json
 import sys
 from dataclasses import Field as DataclassField
@@ -7,17 +8,22 @@ from types import MemberDescriptorType, GenericAlias, FunctionType
 from typing import ClassVar, Dict, Type, Any, List, Self, Optional, Literal
 from .constants import (_T, _DATACLASS_CONFIG_NAME, _DATACLASS_FIELDS_NAME, _BASE_FIELD,
                         _MODULE_IDENTIFIER_RE, InitVar, _FIELD_CLASS_VAR, _FIELD_INIT_VAR,
-                        _FAST_DATACLASS_DECORATORS_NAME,
-                        _FAST_SERIALIZER_NAME, _SUB_VALIDATOR_KWARGS_NAME, _FAST_DESERIALIZER_NAME)
+                        _FAST_DATACLASS_DECORATORS_NAME, _POST_INIT_NAME,
+                        _FAST_SERIALIZER_NAME, _SUB_VALIDATOR_KWARGS_NAME, _FAST_DESERIALIZER_NAME, _MISSING_INPUT)
 from .dataclass_config import DataclassConfig
 from .decorators import FastDataclassDecoratorInfo
 from .field import Field
-from .serializer import FastSerializer, FastDeserializer, matching_serializer
+from .serializer import FastSerializer, FastDeserializer, matching_serializer, _field_init_lines
 from .types import optional, DeserializeError
-from .utils import fast_dataclass_repr, _recursive_repr, is_valid_field_name
-from .validator import matching_validator
+from .utils import fast_dataclass_repr, _recursive_repr, is_valid_field_name, _create_fn
+from .validator import cached_matching_validator
 from .exceptions import ErrorDetail, ValidationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def _tuple_str(obj_name, fields: List[Field]):
     # Return a string representing each field of obj_name as a tuple
@@ -31,32 +37,6 @@ def _tuple_str(obj_name, fields: List[Field]):
     return f'({",".join([f"{obj_name}.{f.name}" for f in fields])},)'
 
 
-def _create_fn(name, args, body, *, _globals=None, _locals=None, return_type=None):
-    # Note that we mutate locals when exec() is called.  Caller
-    # beware!  The only callers are internal to this module, so no
-    # worries about external callers.
-    if _locals is None:
-        _locals = {}
-    if 'BUILTINS' not in _locals:
-        _locals['BUILTINS'] = builtins
-    return_annotation = ''
-    if return_type is not None:
-        _locals['_return_type'] = return_type
-        return_annotation = '->_return_type'
-    args = ','.join(args)
-    body = '\n'.join(f'  {b}' for b in body)
-
-    # Compute the text of the entire function.
-    txt = f' def {name}({args}){return_annotation}:\n{body}'
-
-    local_vars = ', '.join(_locals.keys())
-    txt = f"def __create_fn__({local_vars}):\n{txt}\n return {name}"
-
-    ns = {}
-    exec(txt, _globals, ns)
-    return ns['__create_fn__'](**_locals)
-
-
 def _field_assign(frozen, name, value, self_name):
     # If we're a frozen class, then assign to our fields in __init__
     # via object.__setattr__.  Otherwise, just use a simple
@@ -69,14 +49,92 @@ def _field_assign(frozen, name, value, self_name):
     return f'{self_name}.{name}={value}'
 
 
+def _collect_init_input(field_names, values, kwargs) -> dict:
+    # 还原调用__init__时传入的关键字参数，仅在出错或回退到反序列化器时使用
+    init_input = {name: value for name, value in zip(field_names, values) if value is not _MISSING_INPUT}
+    init_input.update(kwargs)
+    return init_input
+
+
+"""生成的__init__中使用的名称，字段与其同名时不能作为关键字参数"""
+_INIT_RESERVED_NAMES = frozenset({'errors', 'kwargs', 'errs', '__tracebackhide__', '_cls', '_base_init',
+                                  '_deserializer', '_field_names', '_collect_init_input', 'MISSING', 'ErrorDetail',
+                                  'ValidationError', 'validate_iter_with_catch', 'DeserializeError', 'BUILTINS'})
+_INIT_RESERVED_PREFIXES = ('_value_', '_validator_', '_default_', '_default_factory_', '_exact_type_')
+
+
+def _init_fn(cls, fields: List[Field], fast_construct: bool, self_name, _globals):
+    # 为每个数据类生成专用的__init__，字段的默认值处理、验证和赋值语句与反序列化器共用同一生成逻辑。
+    # 字段作为仅关键字参数由解释器直接绑定，字段名与生成代码中的名称冲突时退回到从kwargs中取值。
+    # __init__中始终绕过FastDataclass.__setattr__（冻结检查只针对实例化后的修改）。
+    field_names = tuple(f.name for f in fields)
+    as_params = not any(name == self_name or name in _INIT_RESERVED_NAMES or name.startswith(_INIT_RESERVED_PREFIXES)
+                        for name in field_names)
+    _locals = {
+        '_cls': cls,
+        '_base_init': FastDataclass.__init__,
+        '_deserializer': getattr(cls, _FAST_DESERIALIZER_NAME),
+        '_field_names': field_names,
+        '_collect_init_input': _collect_init_input,
+        'MISSING': _MISSING_INPUT,
+        'ValidationError': ValidationError,
+        'DeserializeError': DeserializeError,
+    }
+    if as_params:
+        input_expr = f'_collect_init_input(_field_names, ({"".join(f"{name}," for name in field_names)}), kwargs)'
+    else:
+        input_expr = 'kwargs'
+    body_lines = [
+        '__tracebackhide__ = True',
+        # 子类自定义__init__并调用super().__init__时，交由子类的反序列化器处理
+        f'if {self_name}.__class__ is not _cls:',
+        f'  return _base_init({self_name}, errors, **{input_expr})',
+        _field_assign(True, '__fast_dataclass_extra__', '{}', self_name),
+        'errs = []',
+    ]
+    # 作为参数时输入值即参数本身，否则从kwargs中取值
+    input_values = field_names if as_params else [f'kwargs.get({name!r}, MISSING)' for name in field_names]
+    body_lines += _field_init_lines(fields, input_values, input_expr, self_name, _locals, fast_construct)
+    # 额外字段的处理方式在调用时读取配置（配置可在类创建后修改）；
+    # 作为参数的字段不在kwargs中，此时kwargs中只剩额外字段，没有额外字段时无需处理
+    if as_params:
+        body_lines += [
+            'if kwargs:',
+            f'  _deserializer.deserialize_extra(kwargs, {self_name}, errs)',
+        ]
+    else:
+        body_lines.append(f'_deserializer.deserialize_extra(kwargs, {self_name}, errs)')
+    body_lines += [
+        "if errs and errors != 'ignore':",
+        f'  raise ValidationError(title={cls.__name__!r}, line_errors=errs)',
+        f'{self_name}.{_POST_INIT_NAME}(None)',
+    ]
+    args = [self_name, '/', "errors: DeserializeError = 'strict'"]
+    if as_params and field_names:
+        args += ['*', *(f'{name}=MISSING' for name in field_names)]
+    args.append('**kwargs')
+    return _create_fn('__init__',
+                      args,
+                      body_lines,
+                      _locals=_locals,
+                      _globals=_globals)
+
+
 def _repr_fn(fields, _globals):
+    # 只从实例字典取值（不会取到类上的Field对象）；
+    # 有字段未赋值（如errors='ignore'时）退回与FastDataclass.__repr__相同的逻辑，跳过未赋值的字段
     fn = _create_fn('__repr__',
                     ('self',),
-                    ['return self.__class__.__qualname__ + f"(' +
-                     ', '.join([f"{f.name}={{self.{f.name}!r}}"
+                    ['_d = self.__dict__',
+                     'try:',
+                     '  return self.__class__.__name__ + f"(' +
+                     ', '.join([f"{f.name}={{_d[{f.name!r}]!r}}"
                                 for f in fields]) +
-                     ')"'],
-                    _globals=_globals)
+                     ')"',
+                     'except KeyError:',
+                     "  return f\"{self.__class__.__name__}({_fast_dataclass_repr(self, ', ')})\""],
+                    _globals=_globals,
+                    _locals={'_fast_dataclass_repr': fast_dataclass_repr})
     return _recursive_repr(fn)
 
 
@@ -141,68 +199,126 @@ def _is_type(annotation, cls, a_module, a_type, is_type_predicate):
     # a eval() penalty for every single field of every dataclass
     # that's defined.  It was judged not worth it.
 
-    match = _MODULE_IDENTIFIER_RE.match(annotation)
-    if match:
+    identifier = _split_module_identifier(annotation)
+    if identifier:
         ns = None
-        module_name = match.group(1)
+        module_name, type_name = identifier
+        module = sys.modules.get(cls.__module__)
         if not module_name:
             # No module name, assume the class's module did
             # "from dataclasses import InitVar".
-            ns = sys.modules.get(cls.__module__).__dict__
+            ns = module.__dict__ if module else None
         else:
             # Look up module_name in the class's module.
-            module = sys.modules.get(cls.__module__)
             if module and module.__dict__.get(module_name) is a_module:
                 ns = sys.modules.get(a_type.__module__).__dict__
-        if ns and is_type_predicate(ns.get(match.group(2)), a_module):
+        if ns and is_type_predicate(ns.get(type_name), a_module):
             return True
     return False
 
 
-def _generate_field(cls, field_name: str, annotation: Any, dataclass_config: DataclassConfig) -> Field:
+@functools.lru_cache(maxsize=1024)
+def _split_module_identifier(annotation: str):
+    # 返回字符串注解的 (模块名, 类型名)，与_MODULE_IDENTIFIER_RE的匹配结果一致，无法匹配时返回None。
+    # 绝大多数注解不带模块名（如"ClassVar[int]"），直接取"["之前的标识符，不经过正则。
+    # 结果只取决于注解字符串本身，按字符串缓存；模块命名空间的查找不缓存，因为类定义时模块可能尚未执行完。
+    if '.' not in annotation:
+        type_name = annotation.lstrip().partition('[')[0]
+        if type_name.isidentifier():
+            return None, type_name
+    match = _MODULE_IDENTIFIER_RE.match(annotation)
+    if match:
+        return match.group(1), match.group(2)
+    return None
+
+
+def _field_from_field(cls, field_name: str, field: Field) -> Field:
+    """已是Field对象"""
+    if cls.__dict__.get(field_name) is not field:
+        # 子类重新声明基类字段时取到的是基类的Field，复制一份，避免修改基类的字段
+        field = copy.copy(field)
+        setattr(cls, field_name, field)
+    return field
+
+
+def _field_from_dataclass_field(cls, field_name: str, dataclass_field: DataclassField) -> Field:
+    """原始数据类字段"""
+    return Field(default=dataclass_field.default, default_factory=dataclass_field.default_factory,
+                 init=dataclass_field.init, repr=dataclass_field.repr)
+
+
+def _field_from_default(cls, field_name: str, default: Any) -> Field:
+    """普通默认值"""
+    field = Field(default=default)
+    setattr(cls, field_name, field)  # 保留Field在未实例的数据类上
+    return field
+
+
+def _field_from_slot(cls, field_name: str, descriptor: MemberDescriptorType) -> Field:
+    # This is a field in __slots__, so it has no default value.
+    # 这是__slots__中的字段，因此它没有默认值。
+    return _field_from_default(cls, field_name, None)
+
+
+"""按类属性的精确类型分派字段的构建方式，未命中时再按isinstance判断子类"""
+_FIELD_BUILDERS = {
+    Field: _field_from_field,
+    DataclassField: _field_from_dataclass_field,
+    MemberDescriptorType: _field_from_slot,
+}
+
+
+def _get_field_builder(field_or_default: Any):
+    builder = _FIELD_BUILDERS.get(type(field_or_default))
+    if builder is not None:
+        return builder
+    if isinstance(field_or_default, Field):
+        return _field_from_field
+    elif isinstance(field_or_default, DataclassField):
+        return _field_from_dataclass_field
+    elif isinstance(field_or_default, MemberDescriptorType):
+        return _field_from_slot
+    return _field_from_default
+
+
+def _generate_field(cls, field_name: str, annotation: Any, dataclass_config: DataclassConfig, _typing,
+                    module) -> Field:
     # Return a Field object for this field name and type.  ClassVars
     # and InitVars are also returned, but marked as such (see f._field_type).
     # 返回此字段名称和类型的Field对象。ClassVars和InitVars也会返回，但标记为这样（请参阅f.field_type）。
+    # _typing和module（当前模块）由调用方在处理整个类前取出一次。
 
     # If the default value isn't derived from Field, then it's only a
     # normal default value.  Convert it to a Field().
     # 如果默认值不是从Field派生的，则它只是一个普通的默认值。将其转换为Field()。
 
     field_or_default = getattr(cls, field_name, None)
-    if isinstance(field_or_default, Field):
-        """已是Field对象"""
-        field = field_or_default
-    elif isinstance(field_or_default, DataclassField):
-        """原始数据类字段"""
-        field = Field(default=field_or_default.default, default_factory=field_or_default.default_factory,
-                      init=field_or_default.init, repr=field_or_default.repr)
-    else:
-        if isinstance(field_or_default, MemberDescriptorType):
-            # This is a field in __slots__, so it has no default value.
-            # 这是__slots__中的字段，因此它没有默认值。
-            field_or_default = None
-        field = Field(default=field_or_default)
-        setattr(cls, field_name, field)  # 保留Field在未实例的数据类上
-
-    field.name = field_name
+    field = _get_field_builder(field_or_default)(cls, field_name, field_or_default)
+
+    field.name = sys.intern(field_name)
     if field.required is None:
         field.required = dataclass_config.required
     field.frozen = dataclass_config.frozen
     field.set_annotation(annotation)
 
     # 组装验证器参数传递
-    field.validator_kwargs = field.validator_kwargs or dict()
-    field.serializer_kwargs = field.serializer_kwargs or dict()
-    if field.min_length:
-        field.validator_kwargs['min_length'] = field.min_length
-    if field.max_length:
-        field.validator_kwargs['max_length'] = field.max_length
-    if field.sub_validator_kwargs:
-        field.validator_kwargs[_SUB_VALIDATOR_KWARGS_NAME] = field.sub_validator_kwargs
+    validator_kwargs = field.validator_kwargs or dict()
+    serializer_kwargs = field.serializer_kwargs or dict()
+    min_length = field.min_length
+    if min_length:
+        validator_kwargs['min_length'] = min_length
+    max_length = field.max_length
+    if max_length:
+        validator_kwargs['max_length'] = max_length
+    sub_validator_kwargs = field.sub_validator_kwargs
+    if sub_validator_kwargs:
+        validator_kwargs[_SUB_VALIDATOR_KWARGS_NAME] = sub_validator_kwargs
+    field.validator_kwargs = validator_kwargs
+    field.serializer_kwargs = serializer_kwargs
     # 查找对应类型的验证器
-    field.validator = matching_validator(annotation, **field.validator_kwargs)
+    field.validator = cached_matching_validator(annotation, **validator_kwargs)
     # 查找对应类型到序列化器
-    field.serializer = matching_serializer(annotation, **field.serializer_kwargs)
+    field.serializer = matching_serializer(annotation, **serializer_kwargs)
 
     # 接下来是对InitVar和ClassVar的支持
     # Assume it's a normal field until proven otherwise.  We're next
@@ -224,7 +340,6 @@ def _generate_field(cls, field_name: str, annotation: Any, dataclass_config: Dat
     # If typing has not been imported, then it's impossible for any
     # annotation to be a ClassVar.  So, only look for ClassVar if
     # typing has been imported by any module (not necessarily cls module).
-    _typing = sys.modules.get('typing')
     if _typing:
         end_if = isinstance(field.annotation, str) and _is_type(field.annotation, cls, _typing, ClassVar, _is_class_var)
         if _is_class_var(annotation) or end_if:
@@ -234,7 +349,6 @@ def _generate_field(cls, field_name: str, annotation: Any, dataclass_config: Dat
     field_type = getattr(annotation, '_field_type', _BASE_FIELD)
     if field_type is _BASE_FIELD:
         # The module we're checking against is the module we're currently in (dataclasses_plus.py).
-        module = sys.modules[__name__]
         if (_is_init_var(field.annotation) or (isinstance(field.annotation, str)
                                                and _is_type(field.annotation, cls, module, InitVar, _is_init_var))):
             setattr(field, '_field_type', _FIELD_INIT_VAR)
@@ -339,8 +453,9 @@ def generate_fast_dataclass(cls: Type[_T]) -> Type[_T]:
     # 我在这里利用这个有序，因为派生类字段覆盖基类字段，但顺序由基类定义，该基类首先找到。
     dataclass_fields = {}
 
-    if cls.__module__ in sys.modules:
-        _globals = sys.modules[cls.__module__].__dict__
+    cls_module = sys.modules.get(cls.__module__)
+    if cls_module is not None:
+        _globals = cls_module.__dict__
     else:
         # Theoretically this can happen if someone writes
         # a custom string to cls.__module__.  In which case
@@ -362,20 +477,37 @@ def generate_fast_dataclass(cls: Type[_T]) -> Type[_T]:
     # 以相反的MRO顺序查找我们的基类，并排除我们自己以相反的顺序，使更多的派生类重写基类中早期的字段定义。
     # 只要我们正在对它们进行迭代，看看是否有冻结的。
 
+    # 基类的字段字典已包含其所有祖先的字段，单继承时直接取直接基类的字段（getattr会沿MRO找到最近的数据类），
+    # 不再逐个遍历MRO重复处理同样的字段
+    if len(cls.__bases__) == 1:
+        bases = cls.__bases__
+    else:
+        bases = cls.__mro__[-1:0:-1]
+
+    # 本类自身的注解需在合并基类注解之前取出快照
+    own_annotations = dict(cls.__dict__.get('__annotations__', {}))
+
     # any_frozen_base = False
     # has_dataclass_bases = False
-    for base in cls.__mro__[-1:0:-1]:
+    inherited_fields = {}
+    for base in bases:
         # Only process classes that have been processed by our
         # decorator.  That is, they have a _FIELDS attribute.
         base_fields = getattr(base, _DATACLASS_FIELDS_NAME, None)
         if base_fields:
             # has_dataclass_bases = True
-            for _field in base_fields.values():
-                dataclass_fields[_field.name] = _field
-                cls.__annotations__[_field.name] = _field.type
-                setattr(cls, _field.name, _field)  # 让未实例时获取为字段信息
+            inherited_fields.update(base_fields)
             # if getattr(base, _DATACLASS_CONFIG_NAME).frozen:
             #     any_frozen_base = True
+    dataclass_fields.update(inherited_fields)
+
+    # 先收集再一次性写入；本类重新声明的字段由下方重新生成，不覆盖其注解和默认值
+    inherited_fields = {name: _field for name, _field in inherited_fields.items() if name not in own_annotations}
+    if inherited_fields:
+        cls.__annotations__.update({name: _field.annotation for name, _field in inherited_fields.items()})
+        for name, _field in inherited_fields.items():
+            if getattr(cls, name, None) is not _field:
+                setattr(cls, name, _field)  # 让未实例时获取为字段信息
 
     # Annotations that are defined in this class (not in base
     # classes).  If __annotations__ isn't present, then this class
@@ -393,19 +525,20 @@ def generate_fast_dataclass(cls: Type[_T]) -> Type[_T]:
     # 字段是从cls_annotations中找到的，保证为命令。默认值来自类属性，如果字段具有默认值。
     # 如果默认值是Field（），则它包含超出（可能包括）的其他信息实际默认值。伪字段ClassVars和InitVars是 包括在内，尽管它们不是真正的领域。
     # 那是稍后处理。
-    cls_annotations = cls.__dict__.get('__annotations__', {})
+    cls_annotations = own_annotations
 
     # Now find fields in our class.  While doing so, validate some
     # things, and set the default values (as class attributes) where we can.
     # 现在在我们班上查找字段。在这样做的同时，验证一些并设置默认值（作为类属性），其中我们可以。
-    cls_fields = [_generate_field(cls, name, annotation, dataclass_config) for name, annotation in
-                  cls_annotations.items()]
-    [dataclass_fields.__setitem__(_field.name, _field) for _field in cls_fields]  # type: ignore
+    _typing = sys.modules.get('typing')
+    module = sys.modules[__name__]
+    for name, annotation in cls_annotations.items():
+        dataclass_fields[name] = _generate_field(cls, name, annotation, dataclass_config, _typing, module)
 
     # Do we have any Field members that don't also have annotations?
     # 我们有没有字段成员也没有注释？
     for field_name, value in cls.__dict__.items():
-        if isinstance(value, Field) and field_name not in cls_annotations:
+        if isinstance(value, Field) and field_name not in cls_annotations and field_name not in inherited_fields:
             raise TypeError(f'{field_name!r} is a field but has no type annotation')
 
     # Remember all the fields on our class (including bases).  This
@@ -416,15 +549,17 @@ def generate_fast_dataclass(cls: Type[_T]) -> Type[_T]:
     # 设置装饰器们
     dataclass_decorators = FastDataclassDecoratorInfo.build(cls)
     setattr(cls, _FAST_DATACLASS_DECORATORS_NAME, dataclass_decorators)
+    # 没有自定义字段验证器时，__init__与反序列化器共用同一快速构建规则
+    fast_construct = not dataclass_decorators.field_validators
 
     # 设置快速数据类的反序列化器
-    fast_deserializer = getattr(cls, _FAST_DESERIALIZER_NAME, None)
+    fast_deserializer = cls.__dict__.get(_FAST_DESERIALIZER_NAME)  # 不使用基类的
     if fast_deserializer is None:
-        fast_deserializer = FastDeserializer(cls)
+        fast_deserializer = FastDeserializer(cls, fast_construct=fast_construct)
         setattr(cls, _FAST_DESERIALIZER_NAME, fast_deserializer)
 
     # 设置快速数据类的序列化器
-    fast_serializer = getattr(cls, _FAST_SERIALIZER_NAME, None)
+    fast_serializer = cls.__dict__.get(_FAST_SERIALIZER_NAME)  # 不使用基类的
     if fast_serializer is None:
         fast_serializer = FastSerializer(cls)
         setattr(cls, _FAST_SERIALIZER_NAME, fast_serializer)
@@ -442,13 +577,18 @@ def generate_fast_dataclass(cls: Type[_T]) -> Type[_T]:
     if dataclass_config.order and not dataclass_config.eq:
         raise ValueError('eq must be true if order is true')
 
-    # Get the fields as a list, and include only real fields.  This is
-    # used in all the following methods.
-    # field_list = [f for f in dataclass_fields.values() if getattr(f, '_field_type', None) is _BASE_FIELD]
+    # 为快速数据类生成专用的__init__（不覆盖类中自定义的__init__）
+    if isinstance(cls, FastDataclassMeta):
+        _set_new_attribute(cls, '__init__', _set_qualname(cls, _init_fn(cls, list(dataclass_fields.values()),
+                                                                        fast_construct, 'self', _globals)))
+
+        # Get the fields as a list, and include only real fields.  This is
+        # used in all the following methods.
+        field_list = [f for f in dataclass_fields.values() if getattr(f, '_field_type', None) is _BASE_FIELD]
 
-    # if dataclass_config.repr:
-    #     _fields = [f for f in field_list if f.repr]
-    #     _set_new_attribute(cls, '__repr__', _repr_fn(_fields, globals))
+        # 生成按字段展开的__repr__，不再在每次调用时遍历实例字典并查找字段
+        _fields = [f for f in field_list if f.repr]
+        _set_new_attribute(cls, '__repr__', _set_qualname(cls, _repr_fn(_fields, _globals)))
 
     # Decide if/how we're going to create a hash function.
     # hash_action = _hash_action[bool(dataclass_config.unsafe_hash), bool(dataclass_config.eq),
@@ -548,16 +688,31 @@ class FastDataclass(metaclass=FastDataclassMeta):
         context: Optional[Any] = None,
         by_alias: bool = False,
         exclude_none: bool = False,
-        errors: Literal['error', 'warn', 'ignore'] = 'warn'
+        errors: Literal['error', 'warn', 'ignore'] = 'warn',
+        use_orjson: bool = False
     ) -> str:
-        return json.dumps(self.__fast_serializer__.to_python(
+        """
+        use_orjson为真时使用orjson编码（需安装orjson）：输出紧凑、不转义非ASCII字符（忽略ensure_ascii），
+        NaN与Infinity编码为null，不支持indent；orjson无法编码的值（如超出64位的整数）退回json按相同格式编码。
+        """
+        value = self.__fast_serializer__.to_python(
             self,
             mode='json',
             context=context,
             by_alias=by_alias,
             exclude_none=exclude_none,
             errors=errors
-        ), indent=indent, ensure_ascii=ensure_ascii)
+        )
+        if use_orjson:
+            if orjson is None:
+                raise ImportError('使用 use_orjson 需要安装 orjson')
+            if indent is not None:
+                raise ValueError('使用 use_orjson 时不支持 indent')
+            try:
+                return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+            except orjson.JSONEncodeError:
+                return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+        return json.dumps(value, indent=indent, ensure_ascii=ensure_ascii)
 
     @classmethod
     def from_object(
@@ -575,10 +730,10 @@ class FastDataclass(metaclass=FastDataclassMeta):
         )
 
     def __str__(self):
-        return f"{self.__class__.__name__}({fast_dataclass_repr(self, ', ')})"
+        return self.__repr__()
 
     def __repr__(self) -> str:
-        return self.__str__()
+        return f"{self.__class__.__name__}({fast_dataclass_repr(self, ', ')})"
 
     def __setattr__(self, key, value) -> None:
         if not is_valid_field_name(key):
@@ -1,5 +1,8 @@
 # -*- coding:utf-8 -*-
 import dataclasses
+import functools
+import sys
+from types import FunctionType, BuiltinFunctionType
 from typing import Optional, Any, Callable, Union
 
 from .types import optional, number
@@ -22,6 +25,9 @@ class Field:
     """验证器"""
     validator: optional[Validator]
 
+    """序列化器"""
+    serializer: Any
+
     """默认值"""
     default: Any
 
@@ -83,7 +89,7 @@ class Field:
     sub_validator_kwargs: optional[Union[dict, list]]
 
     """子序列化器参数"""
-    sub_serializer_extras: optional[Union[dict, list]]
+    sub_serializer_kwargs: optional[Union[dict, list]]
 
     __slots__ = (
         'name',
@@ -112,40 +118,147 @@ class Field:
         'serializer_kwargs',
         'sub_validator_kwargs',
         'sub_serializer_kwargs',
-        '_field_type'
+        '_field_type',
+        '_get_default'
     )
 
-    def __init__(self, **kwargs):
-        kwargs = {k: kwargs.get(k, _DEFAULT_FIELD_VALUES.get(k)) for k in self.__slots__}
-        _ = {setattr(self, k, v) for k, v in kwargs.items()}
-
-        if self.default is dataclasses.MISSING:
-            self.default = None
-
-        if self.default is not None and self.default_factory is not None:
+    def __init__(
+        self,
+        *,
+        name: optional[str] = None,
+        title: optional[str] = None,
+        annotation: optional[type[Any]] = None,
+        validator: optional[Validator] = None,
+        serializer: Any = None,
+        default: Any = None,
+        default_factory: optional[Callable] = None,
+        required: optional[bool] = None,
+        init: optional[bool] = True,
+        repr: optional[bool] = True,
+        alias: optional[str] = None,
+        val_alias: optional[str] = None,
+        ser_alias: optional[str] = None,
+        min: optional[number] = None,
+        max: optional[number] = None,
+        min_length: optional[int] = None,
+        max_length: optional[int] = None,
+        description: optional[str] = None,
+        exclude: optional[bool] = None,
+        deprecated: optional[bool] = None,
+        frozen: optional[bool] = None,
+        init_var: optional[bool] = None,
+        validator_kwargs: optional[Union[dict, list]] = None,
+        serializer_kwargs: optional[Union[dict, list]] = None,
+        sub_validator_kwargs: optional[Union[dict, list]] = None,
+        sub_serializer_kwargs: optional[Union[dict, list]] = None,
+        **kwargs
+    ):
+        # 默认值直接写在签名中，逐个赋值到槽位，不再构造临时字典/集合；
+        # 其余参数（如dataclasses.field的hash、compare、metadata）与之前一样接受但忽略
+        if default is dataclasses.MISSING:
+            default = None
+        # 字段名与别名会作为字典键查找，驻留后查找时可直接比较指针
+        self.name = _intern(name)
+        self.title = title
+        self.annotation = annotation
+        self.validator = validator
+        self.serializer = serializer
+        self.default = default
+        self.default_factory = default_factory
+        self.required = required
+        self.init = init
+        self.repr = repr
+        self.alias = _intern(alias)
+        self.val_alias = _intern(val_alias)
+        self.ser_alias = _intern(ser_alias)
+        self.min = min
+        self.max = max
+        self.min_length = min_length
+        self.max_length = max_length
+        self.description = description
+        self.exclude = exclude
+        self.deprecated = deprecated
+        self.frozen = frozen
+        self.init_var = init_var
+        self.validator_kwargs = validator_kwargs
+        self.serializer_kwargs = serializer_kwargs
+        self.sub_validator_kwargs = sub_validator_kwargs
+        self.sub_serializer_kwargs = sub_serializer_kwargs
+        self._field_type = None
+
+        if default is not None and default_factory is not None:
             raise ValueError(f'不能同时指定 default 和 default_factory')
+        self._get_default = _default_getter(default, default_factory)
 
     def set_annotation(self, annotation):
         if annotation is Optional:
             raise RuntimeError("Optional 必须添加内部类型")
         self.annotation = annotation
 
-    @_recursive_repr
     def __repr__(self):
-        return (f"Field(name={self.name!r}, "
-                f"annotation={_format_type(self.annotation)}, "
-                f"default={self.default!r}, "
-                f"default_factory={self.default_factory!r}, "
-                f"required={self.required!r}, "
-                f"init={self.init!r}, "
-                f"repr={self.repr!r}, "
-                f"description={self.description!r})")
+        # 默认值为原子类型、默认工厂为类或函数时不可能递归引用自身，无需经过递归保护
+        if type(self.default) in _ATOMIC_REPR_TYPES and (
+                self.default_factory is None or type(self.default_factory) in _ATOMIC_REPR_FACTORY_TYPES):
+            return _field_repr(self)
+        return _recursive_field_repr(self)
 
     def get_default_value(self):
-        value = None if self.default is None else self.default
-        if value is None:
-            value = self.default_factory() if self.default_factory is not None else value
-        return value
+        return self._get_default()
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_format_type(annotation_id: int, annotation) -> str:
+    return _format_type(annotation)
+
+
+def _format_annotation(annotation) -> str:
+    """
+    按注解缓存格式化结果，重复repr同一注解时无需再次判断；不可哈希的注解直接格式化。
+    以注解的id区分相等但不同的注解（如int | str与Union[int, str]相等，格式化结果却不同）。
+    """
+    try:
+        return _cached_format_type(id(annotation), annotation)
+    except TypeError:
+        return _format_type(annotation)
+
+
+def _intern(name: optional[str]) -> optional[str]:
+    return sys.intern(name) if type(name) is str else name
+
+
+def _return_none():
+    return None
+
+
+def _default_getter(default, default_factory) -> Callable[[], Any]:
+    """构建字段时确定取默认值的方式，取值时无需再逐个判断"""
+    if default_factory is not None:
+        return default_factory
+    if default is not None:
+        return lambda _default=default: _default
+    return _return_none
+
+
+"""repr不会引用其他对象的默认值类型"""
+_ATOMIC_REPR_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes})
+
+"""repr不会引用其他对象的默认工厂类型"""
+_ATOMIC_REPR_FACTORY_TYPES = frozenset({type, FunctionType, BuiltinFunctionType})
+
+
+def _field_repr(field: Field) -> str:
+    # f-string的拼接比 % 格式化更快，保持f-string
+    return (f"Field(name={field.name!r}, "
+            f"annotation={_format_annotation(field.annotation)}, "
+            f"default={field.default!r}, "
+            f"default_factory={field.default_factory!r}, "
+            f"required={field.required!r}, "
+            f"init={field.init!r}, "
+            f"repr={field.repr!r}, "
+            f"description={field.description!r})")
+
+
+_recursive_field_repr = _recursive_repr(_field_repr)
 
 
 # This function is used instead of exposing Field creation directly,
@@ -178,33 +291,3 @@ def field(
     return Field(default=default, default_factory=default_factory, required=required, min_length=min_length,
                  max_length=max_length, validator_kwargs=validator_kwargs, sub_validator_kwargs=sub_validator_kwargs,
                  **kwargs)
-
-
-_DEFAULT_FIELD_VALUES: dict = dict(
-    name=None,
-    title=None,
-    vaildator=None,
-    serializer=None,
-    annotation=None,
-    default=None,
-    default_factory=None,
-    required=None,
-    init=True,
-    repr=True,
-    alias=None,
-    val_alias=None,
-    ser_alias=None,
-    min=None,
-    max=None,
-    min_length=None,
-    max_length=None,
-    description=None,
-    exclude=None,
-    deprecated=None,
-    frozen=None,
-    init_var=None,
-    validator_kwargs=None,
-    serializer_kwargs=None,
-    sub_validator_kwargs=None,
-    sub_serializer_kwargs=None,
-)
\ No newline at end of file
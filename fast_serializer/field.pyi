@@ -83,7 +83,37 @@ class Field:
     """子序列化器参数"""
     sub_serializer_kwargs: optional[Union[dict, list]]
 
-    def __init__(self, **kwargs): ...
+    def __init__(
+        self,
+        *,
+        name: optional[str] = None,
+        title: optional[str] = None,
+        annotation: optional[type[Any]] = None,
+        validator: optional[Validator] = None,
+        serializer: optional[Serializer] = None,
+        default: Any = None,
+        default_factory: optional[Callable] = None,
+        required: optional[bool] = None,
+        init: optional[bool] = True,
+        repr: optional[bool] = True,
+        alias: optional[str] = None,
+        val_alias: optional[str] = None,
+        ser_alias: optional[str] = None,
+        min: optional[number] = None,
+        max: optional[number] = None,
+        min_length: optional[int] = None,
+        max_length: optional[int] = None,
+        description: optional[str] = None,
+        exclude: optional[bool] = None,
+        deprecated: optional[bool] = None,
+        frozen: optional[bool] = None,
+        init_var: optional[bool] = None,
+        validator_kwargs: optional[Union[dict, list]] = None,
+        serializer_kwargs: optional[Union[dict, list]] = None,
+        sub_validator_kwargs: optional[Union[dict, list]] = None,
+        sub_serializer_kwargs: optional[Union[dict, list]] = None,
+        **kwargs: Any
+    ): ...
 
     def set_annotation(self, annotation): ...
 
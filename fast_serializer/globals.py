@@ -2,41 +2,66 @@
 import os
 
 
+"""语言代码 Language code"""
+LANGUAGE_CODE = os.environ.get('language', 'zh-Hans')
+
+"""数据类默认必填"""
+DATACLASS_DEFAULT_REQUIRED = os.environ.get('required', True)
+
+"""是否启用国际化"""
+USE_I18N = True
+
+
+def get_language():
+    return LANGUAGE_CODE
+
+
+def set_language(language_code):
+    global LANGUAGE_CODE
+    LANGUAGE_CODE = GlobalSetting.LANGUAGE_CODE = language_code
+    return LANGUAGE_CODE
+
+
+def get_i18n():
+    return USE_I18N
+
+
+def set_i18n(use_i18n):
+    global USE_I18N
+    USE_I18N = GlobalSetting.USE_I18N = use_i18n
+    return USE_I18N
+
+
+def get_dataclass_default_required():
+    return DATACLASS_DEFAULT_REQUIRED
+
+
+def set_dataclass_default_required(default_required: bool):
+    global DATACLASS_DEFAULT_REQUIRED
+    DATACLASS_DEFAULT_REQUIRED = GlobalSetting.DATACLASS_DEFAULT_REQUIRED = default_required
+    return DATACLASS_DEFAULT_REQUIRED
+
+
 class GlobalSetting:
-    """全局设置"""
+    """全局设置（兼容旧接口，实际取值以模块级变量为准，内部直接调用模块级函数）"""
 
     """语言代码 Language code"""
-    LANGUAGE_CODE = os.environ.get('language', 'zh-Hans')
+    LANGUAGE_CODE = LANGUAGE_CODE
 
     """数据类默认必填"""
-    DATACLASS_DEFAULT_REQUIRED = os.environ.get('required', True)
+    DATACLASS_DEFAULT_REQUIRED = DATACLASS_DEFAULT_REQUIRED
 
     """是否启用国际化"""
-    USE_I18N = True
-
-    @classmethod
-    def get_language(cls):
-        return cls.LANGUAGE_CODE
-    
-    @classmethod
-    def set_language(cls, language_code):
-        cls.LANGUAGE_CODE = language_code
-        return cls.LANGUAGE_CODE
-
-    @classmethod
-    def get_i18n(cls):
-        return cls.USE_I18N
-
-    @classmethod
-    def set_i18n(cls, use_i18n):
-        cls.USE_I18N = use_i18n
-        return cls.USE_I18N
-
-    @classmethod
-    def get_dataclass_default_required(cls):
-        return cls.DATACLASS_DEFAULT_REQUIRED
-
-    @classmethod
-    def set_dataclass_default_required(cls, default_required: bool):
-        cls.DATACLASS_DEFAULT_REQUIRED = default_required
-        return cls.DATACLASS_DEFAULT_REQUIRED
\ No newline at end of file
+    USE_I18N = USE_I18N
+
+    get_language = staticmethod(get_language)
+
+    set_language = staticmethod(set_language)
+
+    get_i18n = staticmethod(get_i18n)
+
+    set_i18n = staticmethod(set_i18n)
+
+    get_dataclass_default_required = staticmethod(get_dataclass_default_required)
+
+    set_dataclass_default_required = staticmethod(set_dataclass_default_required)
@@ -1,79 +1,85 @@
 # -*- coding:utf-8 -*-
-from sqlalchemy import Column, String, Integer, BigInteger, DECIMAL, Enum, JSON, Boolean, Date, DateTime
+import functools
+from sqlalchemy import Column, String, Integer, BigInteger, Float, DECIMAL, Enum, JSON, Boolean, Date, DateTime
 from ..types import optional
 
 
-class ModelField(Column):
-    """模型字段"""
-    pass
+"""模型字段（各字段函数直接返回Column，不再经过子类的__init__）"""
+ModelField = Column
 
+"""无参数的列类型可在各列间共用，模块加载时实例化一次"""
+_INTEGER = Integer()
+_BIG_INTEGER = BigInteger()
+_BOOLEAN = Boolean()
+_DATE = Date()
+_DATE_TIME = DateTime()
+_JSON = JSON()
 
-class IntegerField(ModelField):
-    """整数型字段 int"""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(Integer, *args, **kwargs)
+@functools.lru_cache(maxsize=None)
+def _string_type(length: optional[int]) -> String:
+    return String(length)
 
 
-class BigIntegerField(ModelField):
-    """长整型字段 bigint"""
+@functools.lru_cache(maxsize=None)
+def _float_type(precision) -> Float:
+    return Float(precision=precision)
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(BigInteger, *args, **kwargs)
 
+@functools.lru_cache(maxsize=None)
+def _decimal_type(precision: int, scale: int) -> DECIMAL:
+    return DECIMAL(precision=precision, scale=scale)
 
-class CharField(ModelField):
-    """字符字段"""
 
-    def __init__(self, *args, length: optional[int] = 255, **kwargs):
-        super().__init__(String(length), *args, **kwargs)
+def IntegerField(*args, **kwargs) -> Column:
+    """整数型字段 int"""
+    return Column(_INTEGER, *args, **kwargs)
 
 
-class FloatField(ModelField):
-    """浮点型字段 float"""
+def BigIntegerField(*args, **kwargs) -> Column:
+    """长整型字段 bigint"""
+    return Column(_BIG_INTEGER, *args, **kwargs)
 
-    def __init__(self, *args, precision: str = '10,2', **kwargs):
-        """FloatField(precision='10,2') || 2.0版本后sqlalchemy更新了"""
-        super().__init__(Float(precision=precision), *args, **kwargs)  # type: ignore
 
+def CharField(*args, length: optional[int] = 255, **kwargs) -> Column:
+    """字符字段"""
+    return Column(_string_type(length), *args, **kwargs)
 
-class DecimalField(ModelField):
-    """高精度型字段"""
 
-    def __init__(self, *args, precision: int = 10, scale: int = 2, **kwargs):
-        super().__init__(DECIMAL(precision=precision, scale=scale), *args, **kwargs)
+def FloatField(*args, precision: str = '10,2', **kwargs) -> Column:
+    """浮点型字段 float
 
+    FloatField(precision='10,2') || 2.0版本后sqlalchemy更新了
+    """
+    return Column(_float_type(precision), *args, **kwargs)
 
-class BooleanField(ModelField):
-    """布尔型字段 bool"""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(Boolean, *args, **kwargs)
+def DecimalField(*args, precision: int = 10, scale: int = 2, **kwargs) -> Column:
+    """高精度型字段"""
+    return Column(_decimal_type(precision, scale), *args, **kwargs)
 
 
-class DateField(ModelField):
-    """日期型字段 date"""
+def BooleanField(*args, **kwargs) -> Column:
+    """布尔型字段 bool"""
+    return Column(_BOOLEAN, *args, **kwargs)
+
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(Date, *args, **kwargs)
+def DateField(*args, **kwargs) -> Column:
+    """日期型字段 date"""
+    return Column(_DATE, *args, **kwargs)
 
 
-class DateTimeField(ModelField):
+def DateTimeField(*args, **kwargs) -> Column:
     """日期时间型字段 datetime"""
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(DateTime, *args, **kwargs)
+    return Column(_DATE_TIME, *args, **kwargs)
 
 
-class EnumField(ModelField):
+def EnumField(*args, value: Enum, **kwargs) -> Column:
     """枚举型字段 enum"""
+    # 枚举类型带有名称与约束，每列单独创建
+    return Column(Enum(value), *args, **kwargs)
 
-    def __init__(self, *args, value: Enum, **kwargs):
-        super().__init__(Enum(value), *args, **kwargs)
 
-
-class JSONField(ModelField):
+def JSONField(*args, **kwargs) -> Column:
     """JSON字段"""
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(JSON, *args, **kwargs)
\ No newline at end of file
+    return Column(_JSON, *args, **kwargs)
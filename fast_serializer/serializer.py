@@ -1,25 +1,92 @@
 # -*- coding:utf-8 -*-
 import collections.abc
-import copy
 import datetime
 import decimal
 import enum
+import functools
+import sys
 import uuid
 import warnings
 from abc import ABC
+from dataclasses import MISSING
+from itertools import repeat
+from types import GeneratorType
 from typing import Dict, Any, Union, List, Callable, Generator, Optional, get_args, Literal, Tuple, Mapping, Set, \
-    FrozenSet, Type
+    FrozenSet, Type, Iterable
 
 from fast_serializer import DataclassConfig
 
-from .constants import _DATACLASS_FIELDS_NAME, _POST_INIT_NAME, SerMode, _T, _DATACLASS_CONFIG_NAME
+from .constants import (_DATACLASS_FIELDS_NAME, _POST_INIT_NAME, SerMode, _T, _DATACLASS_CONFIG_NAME, ExtraMode,
+                        _MISSING_INPUT)
 from .exceptions import (ErrorDetail, ValidationError, SerializationError, SerializerBuildingError,
                          SerializationValueError)
 from .field import Field
 from .type_parser import type_parser
 from .types import optional, DeserializeError, SerializeError
-from .utils import isinstance_safe, _format_type, issubclass_safe, get_sub_serializer_kwargs
-from .validator import validate_iter_with_catch
+from .utils import (isinstance_safe, _format_type, get_sub_serializer_kwargs, is_enum_class,
+                    is_enum_instance, is_numpy_array, _create_fn)
+from .validator import validate_iter_with_catch, Validator
+
+
+def _field_init_lines(fields: Iterable[Field], input_values: Iterable[str], input_expr: str, instance_name: str,
+                      _locals: dict, fast_construct: bool = False) -> List[str]:
+    """
+    生成按字段展开的默认值处理、验证与赋值语句，生成的__init__与反序列化器共用。
+    input_values为各字段输入值的表达式（缺失时为MISSING），验证后的值存放在单独的局部变量中，输入值保持原样，
+    出错时由input_expr还原真实的输入；生成代码中用到的名称写入_locals。
+    fast_construct为真（没有自定义字段验证器）时，Any字段不验证，输入值类型与验证器的精确类型相同时也直接赋值。
+    """
+    _locals.update({
+        'MISSING': _MISSING_INPUT,
+        'ErrorDetail': ErrorDetail,
+        'validate_iter_with_catch': validate_iter_with_catch,
+    })
+    body_lines = []
+    for index, (field, input_value) in enumerate(zip(fields, input_values)):
+        name = field.name
+        value = f'_value_{index}'
+        if input_value != value:
+            body_lines.append(f'{value} = {input_value}')
+        _locals[f'_validator_{index}'] = field.validator
+        # 默认值在构建时确定：可变默认值已被禁止，普通默认值直接作为缺省值，
+        # 只有默认工厂需要在缺失时调用
+        if field.default is not None:
+            _locals[f'_default_{index}'] = field.default
+            missing_value = f'_default_{index}'
+        elif field.default_factory is not None:
+            _locals[f'_default_factory_{index}'] = field.default_factory
+            missing_value = f'_default_factory_{index}()'
+        else:
+            missing_value = 'None'
+        body_lines += [
+            f'if {value} is MISSING:',
+            f'  {value} = {missing_value}',
+            f'if {value} is not None:',
+        ]
+        validate_line = f'{value} = validate_iter_with_catch({value}, _validator_{index}, [{name!r}], errs)'
+        if not fast_construct:
+            body_lines.append(f'  {validate_line}')
+        elif field.validator.exact_type is not None:
+            _locals[f'_exact_type_{index}'] = field.validator.exact_type
+            body_lines += [
+                f'  if BUILTINS.type({value}) is not _exact_type_{index}:',
+                f'    {validate_line}',
+            ]
+        elif field.validator.annotation is not Any:
+            body_lines.append(f'  {validate_line}')
+        # 初始化时绕过冻结检查
+        body_lines.append(f'  BUILTINS.object.__setattr__({instance_name}, {name!r}, {value})')
+        if field.required:
+            body_lines += [
+                'else:',
+                f"  errs.append(ErrorDetail([{name!r}], {input_expr}, 'missing', '字段为必填项'))",
+            ]
+        else:
+            body_lines += [
+                'else:',
+                f'  BUILTINS.object.__setattr__({instance_name}, {name!r}, None)',
+            ]
+    return body_lines
 
 
 class FastDeserializer:
@@ -28,11 +95,35 @@ class FastDeserializer:
     name: str
     fast_dataclass: Type[_T]
     fields: Dict[str, Field]
-
-    def __init__(self, dataclass: Type[_T], fields: optional[Dict[str, Field]] = None):
+    """按字段顺序排列的字段名，反序列化时据此批量取值"""
+    field_names: Tuple[str, ...]
+    """是否启用快速构建（与生成的__init__一致，没有自定义字段验证器时为真）"""
+    fast_construct: bool
+    """按字段展开生成的字段反序列化函数"""
+    _deserialize_fields_fn: Callable[[Iterable[Any], Any, _T, List[ErrorDetail]], None]
+
+    def __init__(self, dataclass: Type[_T], fields: optional[Dict[str, Field]] = None,
+                 fast_construct: bool = False):
         self.dataclass = dataclass
         self.name = dataclass.__name__
         self.fields = fields or getattr(dataclass, _DATACLASS_FIELDS_NAME, {})
+        # 字段名驻留，字典查找时可直接比较指针
+        self.field_names = tuple(sys.intern(field_name) for field_name in self.fields)
+        self.fast_construct = fast_construct
+        self._deserialize_fields_fn = self._generate_deserialize_fields_fn()
+
+    def _generate_deserialize_fields_fn(self) -> Callable[[Iterable[Any], Any, _T, List[ErrorDetail]], None]:
+        # 构建时为数据类生成专用的字段反序列化函数：输入值一次性解包到局部变量，
+        # 每个字段展开为直接的默认值处理、验证和赋值语句
+        _locals = {}
+        value_names = [f'_value_{index}' for index in range(len(self.field_names))]
+        body_lines = [f'{"".join(f"{value}," for value in value_names)} = field_values'] if value_names else ['pass']
+        body_lines += _field_init_lines(self.fields.values(), value_names, 'input', 'instance', _locals,
+                                        self.fast_construct)
+        fn = _create_fn('_deserialize_fields', ('field_values', 'input', 'instance', 'errs'), body_lines,
+                        _locals=_locals)
+        fn.__qualname__ = f'{self.name}.{fn.__name__}'
+        return fn
 
     def deserialize(self, input: Union[dict, object], errors: DeserializeError = 'strict', context: optional[Any] = None,
                     instance: _T = None) -> _T:
@@ -48,40 +139,34 @@ class FastDeserializer:
         return instance
 
     def deserialize_init(self, input: Union[dict, object], instance: _T, errors: DeserializeError = 'strict'):
-        is_dict: bool = isinstance_safe(input, dict)
         errs: List[ErrorDetail] = []
-        field_name: str
-        field: Field
-        for field_name, field in self.fields.items():
-            try:
-                field_value = input[field_name] if is_dict else getattr(input, field_name)
-            except (KeyError, AttributeError):
-                # missing use field default
-                field_value = field.get_default_value()
-            if field_value is None and field.required:
-                errs.append(ErrorDetail([field_name], input, 'missing', '字段为必填项'))
-                continue
-            elif field_value is not None:
-                field_value = validate_iter_with_catch(field_value, field.validator, [field_name], errs)
-
-            setattr(instance, field_name, field_value)
-
-        if is_dict:
-            dataclass_config = getattr(self.dataclass, _DATACLASS_CONFIG_NAME, DataclassConfig())
-            for key, value in input.items():
-                if key in self.fields:
-                    continue
-                if dataclass_config.extra == 'ignore':
-                    continue
-                elif dataclass_config.extra == 'forbid':
-                    err = ErrorDetail([key], value, 'extra_forbidden', '不允许额外字段')
-                    errs.append(err)
-                else:
-                    instance.fast_dataclass_extra[key] = value
+        # 只判断一次输入类型，字典与对象分别在C层面批量取值，循环中不再按输入类型分支
+        if isinstance_safe(input, dict):
+            field_values = map(input.get, self.field_names, repeat(_MISSING_INPUT))
+            self._deserialize_fields_fn(field_values, input, instance, errs)
+            self.deserialize_extra(input, instance, errs)
+        else:
+            field_values = map(getattr, repeat(input), self.field_names, repeat(_MISSING_INPUT))
+            self._deserialize_fields_fn(field_values, input, instance, errs)
 
         if errs and errors != 'ignore':
             raise ValidationError(title=self.name, line_errors=errs)
 
+    def deserialize_extra(self, input: dict, instance: _T, errs: List[ErrorDetail]):
+        """处理额外字段"""
+        dataclass_config = getattr(self.dataclass, _DATACLASS_CONFIG_NAME, DataclassConfig())
+        extra_mode: ExtraMode = dataclass_config.extra_mode
+        if extra_mode is ExtraMode.ignore:
+            return
+        for key, value in input.items():
+            if key in self.fields:
+                continue
+            if extra_mode is ExtraMode.forbid:
+                err = ErrorDetail([key], value, 'extra_forbidden', '不允许额外字段')
+                errs.append(err)
+            else:
+                instance.__fast_dataclass_extra__[key] = value
+
     @staticmethod
     def call_post_init(instance: _T, context: optional[Any] = None):
         if hasattr(instance, _POST_INIT_NAME):
@@ -111,6 +196,7 @@ class SerParameter:
     include: optional[dict]
     errors: SerializeError
     check: SerCheck
+    """检查模式：联合序列化器在尝试子序列化器期间原地开启，结束后（包括异常时）恢复原值，嵌套时逐层恢复"""
 
     __slots__ = ('mode', 'error_messages', 'by_alias', 'exclude_unset', 'exclude_none', 'context',
                  'fallback', 'exclude', 'include', 'errors', 'check')
@@ -142,7 +228,7 @@ class SerParameter:
     def on_fallback(self, expect_type, value: Any, got_type):
         if value is None:
             return value
-        elif self.check != SerCheck.NONE:
+        elif self.check is not SerCheck.NONE:
             raise SerializationValueError(f'检查异常已开启，此异常为序列化器异常，如果您看到此异常在序列化中发生请反馈到社区。')
         else:
             self.fallback_error(expect_type, got_type or type(value))
@@ -165,6 +251,14 @@ class SerParameter:
             warnings.warn(error_msg)
 
 
+"""序列化为JSON时原样输出的基本类型"""
+_PRIMITIVE_JSON_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+"""序列化模式值到枚举的映射，避免每次序列化都通过SerMode(mode)查找"""
+_SER_MODES: Dict[str, SerMode] = {ser_mode.value: ser_mode for ser_mode in SerMode}
+
+
 class FastFilter:
     """筛选"""
 
@@ -183,10 +277,50 @@ class FastSerializer:
     fast_dataclass: Type[_T]
     fields: Dict[str, Field]
 
+    """按字段展开生成的序列化函数，分别对应python模式与json模式，下标为是否排除None值"""
+    _to_python_fns: Tuple[Callable[[dict, 'SerParameter'], dict], Callable[[dict, 'SerParameter'], dict]]
+    _serialize_fns: Tuple[Callable[[dict, 'SerParameter'], dict], Callable[[dict, 'SerParameter'], dict]]
+
     def __init__(self, dataclass: Type[_T], fields: optional[Dict[str, Field]] = None):
         self.dataclass = dataclass
         self.name = dataclass.__name__
         self.fields = fields or getattr(dataclass, _DATACLASS_FIELDS_NAME, {})
+        self._to_python_fns = (self._serialize_fields_fn('to_python', False),
+                               self._serialize_fields_fn('to_python', True))
+        self._serialize_fns = (self._serialize_fields_fn('serialize', False),
+                               self._serialize_fields_fn('serialize', True))
+
+    def _serialize_fields_fn(self, method_name: str, exclude_none: bool) -> Callable[[dict, 'SerParameter'], dict]:
+        # 构建时为数据类生成专用的序列化函数，每个字段展开为直接的取值与序列化器调用，
+        # 替代每次序列化时遍历字段字典并查找序列化器的通用循环；
+        # 序列化模式与是否排除None在循环外已确定，分别生成，字段中不再判断
+        _locals = {}
+        body_lines = ['out_dict = {}']
+        indent = '  ' if exclude_none else ''
+        for index, (field_name, field) in enumerate(self.fields.items()):
+            serializer: Serializer = field.serializer
+            _locals[f'_serializer_{index}'] = getattr(serializer, method_name)
+            body_lines.append(f'value = dict_value.get({field_name!r})')
+            if exclude_none:
+                body_lines.append('if value is not None:')
+            call_line = f'out_dict[{field_name!r}] = _serializer_{index}(value, ser_parameter)'
+            exact_type = passthrough_type(serializer)
+            if exact_type is not None:
+                # 原样返回的序列化器（如str、int），类型精确匹配时直接取值，不再调用
+                _locals[f'_annotation_{index}'] = exact_type
+                body_lines += [
+                    f'{indent}if BUILTINS.type(value) is _annotation_{index}:',
+                    f'{indent}  out_dict[{field_name!r}] = value',
+                    f'{indent}else:',
+                    f'{indent}  {call_line}',
+                ]
+            else:
+                body_lines.append(f'{indent}{call_line}')
+        body_lines.append('return out_dict')
+        fn_name = f'_{method_name}_fields_exclude_none' if exclude_none else f'_{method_name}_fields'
+        fn = _create_fn(fn_name, ('dict_value', 'ser_parameter'), body_lines, _locals=_locals)
+        fn.__qualname__ = f'{self.name}.{fn.__name__}'
+        return fn
 
     def to_python(
         self,
@@ -201,10 +335,8 @@ class FastSerializer:
         context: optional[Any] = None,
     ) -> dict:
         """序列化到Python对象，JSON模式为任意语言可识别的JSON dict"""
-        dict_value: dict = value.__dict__
-        out_dict: dict = {}
         ser_parameter = SerParameter(
-            mode=SerMode(mode),
+            mode=_SER_MODES.get(mode) or SerMode(mode),
             by_alias=by_alias,
             include=include,
             exclude=exclude,
@@ -212,15 +344,8 @@ class FastSerializer:
             context=context,
             errors=errors,
         )
-        for field_name, field in self.fields.items():
-            serialize_value = dict_value.get(field_name)
-            if exclude_none and serialize_value is None:
-                continue
-            if mode == 'python':
-                out_value = field.serializer.to_python(serialize_value, ser_parameter)
-            else:
-                out_value = field.serializer.serialize(serialize_value, ser_parameter)
-            out_dict[field_name] = out_value
+        fns = self._to_python_fns if ser_parameter.mode is SerMode.python else self._serialize_fns
+        out_dict: dict = fns[1 if exclude_none else 0](value.__dict__, ser_parameter)
 
         # 将额外的dict加入序列化
 
@@ -234,6 +359,30 @@ class FastSerializer:
     # def _dataclass_to_python(self):
 
 
+def _identity(value, parameter: SerParameter):
+    return value
+
+
+def passthrough_type(serializer: 'Serializer') -> optional[type]:
+    """未覆盖检查逻辑且原样返回的序列化器（如str、int）返回其类型，值的类型与之精确相同时可直接使用原值"""
+    serializer_class = type(serializer)
+    if (serializer_class.to_python is Serializer.to_python and serializer_class.serialize is Serializer.serialize
+            and serializer.uncheck_to_python is _identity and serializer.uncheck_serialize is _identity
+            and isinstance(serializer.annotation, type)):
+        return serializer.annotation
+    return None
+
+
+"""可重复迭代的内置容器类型，检查元素类型后仍可再次迭代复制；生成器等一次性迭代器不在其中"""
+_REITERABLE_TYPES = frozenset({list, tuple, set, frozenset, dict, type({}.keys()), type({}.values())})
+
+
+def is_exact_items(items, exact_type: optional[type]) -> bool:
+    """元素的类型是否都精确为exact_type（在C层面收集类型），只检查可重复迭代的内置容器，避免消耗一次性迭代器"""
+    return (exact_type is not None and type(items) in _REITERABLE_TYPES
+            and set(map(type, items)) <= {exact_type})
+
+
 class Serializer(ABC):
 
     serializer_name: str
@@ -246,22 +395,19 @@ class Serializer(ABC):
         return self.serializer_name
 
     def to_python(self, value, parameter: SerParameter):
-        if isinstance_safe(value, self.annotation):
+        # 精确类型只需比较指针，不匹配时再经过isinstance_safe
+        if type(value) is self.annotation or isinstance_safe(value, self.annotation):
             return self.uncheck_to_python(value, parameter)
         return serialize_any_to_python(value, parameter, self.annotation)
 
     def serialize(self, value, parameter: SerParameter):
-        if isinstance_safe(value, self.annotation):
+        if type(value) is self.annotation or isinstance_safe(value, self.annotation):
             return self.uncheck_serialize(value, parameter)
         return serialize_any_to_json_value(value, parameter, self.annotation)
 
-    @classmethod
-    def uncheck_to_python(cls, value, parameter: SerParameter):
-        return value
-
-    @classmethod
-    def uncheck_serialize(cls, value, parameter: SerParameter):
-        return value
+    """默认原样返回，生成的序列化函数据此在类型精确匹配时省去调用"""
+    uncheck_to_python = staticmethod(_identity)
+    uncheck_serialize = staticmethod(_identity)
 
     @classmethod
     def build(cls, annotation, **kwargs) -> 'Serializer':
@@ -295,20 +441,6 @@ class StrSerializer(Serializer):
     serializer_name = 'str'
     annotation = str
 
-    def to_python(self, value, parameter: SerParameter) -> str:
-        return super().to_python(value, parameter)
-
-    def serialize(self, value, parameter: SerParameter) -> str:
-        return super().serialize(value, parameter)
-
-    @classmethod
-    def uncheck_to_python(cls, value, parameter: SerParameter) -> str:
-        return super().uncheck_to_python(value, parameter)
-
-    @classmethod
-    def uncheck_serialize(cls, value, parameter: SerParameter) -> str:
-        return super().uncheck_serialize(value, parameter)
-
 
 class FloatSerializer(Serializer):
     """浮点数序列化器"""
@@ -316,20 +448,6 @@ class FloatSerializer(Serializer):
     serializer_name = 'float'
     annotation = float
 
-    def to_python(self, value, parameter: SerParameter) -> float:
-        return super().to_python(value, parameter)
-
-    def serialize(self, value, parameter: SerParameter) -> float:
-        return super().serialize(value, parameter)
-
-    @classmethod
-    def uncheck_to_python(cls, value, parameter: SerParameter) -> float:
-        return super().uncheck_to_python(value, parameter)
-
-    @classmethod
-    def uncheck_serialize(cls, value, parameter: SerParameter) -> float:
-        return super().uncheck_serialize(value, parameter)
-
 
 class IntegerSerializer(Serializer):
     """整数序列化器"""
@@ -337,20 +455,6 @@ class IntegerSerializer(Serializer):
     serializer_name = 'int'
     annotation = int
 
-    def to_python(self, value, parameter: SerParameter) -> int:
-        return super().to_python(value, parameter)
-
-    def serialize(self, value, parameter: SerParameter) -> int:
-        return super().serialize(value, parameter)
-
-    @classmethod
-    def uncheck_to_python(cls, value, parameter: SerParameter) -> int:
-        return super().uncheck_to_python(value, parameter)
-
-    @classmethod
-    def uncheck_serialize(cls, value, parameter: SerParameter) -> int:
-        return super().uncheck_serialize(value, parameter)
-
 
 class BoolSerializer(Serializer):
     """布尔序列化器"""
@@ -358,20 +462,6 @@ class BoolSerializer(Serializer):
     serializer_name = 'bool'
     annotation = bool
 
-    def to_python(self, value, parameter: SerParameter) -> bool:
-        return super().to_python(value, parameter)
-
-    def serialize(self, value, parameter: SerParameter) -> bool:
-        return super().serialize(value, parameter)
-
-    @classmethod
-    def uncheck_to_python(cls, value, parameter: SerParameter) -> bool:
-        return super().uncheck_to_python(value, parameter)
-
-    @classmethod
-    def uncheck_serialize(cls, value, parameter: SerParameter) -> bool:
-        return super().uncheck_serialize(value, parameter)
-
 
 class DecimalSerializer(Serializer):
     """数值序列化器"""
@@ -383,7 +473,7 @@ class DecimalSerializer(Serializer):
         return super().to_python(value, parameter)
 
     def serialize(self, value, parameter: SerParameter) -> str:
-        if isinstance_safe(value, self.annotation):
+        if type(value) is self.annotation or isinstance_safe(value, self.annotation):
             return self.uncheck_serialize(value, parameter)
         return serialize_any_to_python(value, parameter)
 
@@ -416,7 +506,8 @@ class BytesSerializer(Serializer):
 
     @classmethod
     def uncheck_serialize(cls, value, parameter: SerParameter) -> str:
-        return value.decode('utf-8')
+        # 不传编码名时直接使用默认的utf-8解码器，省去编码名的查找与规范化
+        return value.decode()
 
 
 class DatetimeSerializer(Serializer):
@@ -462,7 +553,8 @@ class DateSerializer(Serializer):
 
     @classmethod
     def uncheck_serialize(cls, value, parameter: SerParameter) -> str:
-        return value.strftime("%Y-%m-%d")
+        # 调用date自身的isoformat（C实现，无需解析格式串），datetime实例也只输出日期部分
+        return datetime.date.isoformat(value)
 
 
 class TimeSerializer(Serializer):
@@ -485,6 +577,9 @@ class TimeSerializer(Serializer):
 
     @classmethod
     def uncheck_serialize(cls, value, parameter: SerParameter) -> str:
+        if value.tzinfo is None:
+            # C实现的isoformat无需解析格式串；带时区时isoformat会附加偏移，仍使用strftime
+            return datetime.time.isoformat(value, 'seconds')
         return value.strftime("%H:%M:%S")
 
 
@@ -508,18 +603,20 @@ class TimeDeltaSerializer(Serializer):
 
     @classmethod
     def uncheck_serialize(cls, value, parameter: SerParameter) -> str:
-        str_value = str(value)
-        length = len(str_value)
-        if length <= 8:
-            return str_value
-        else:
-            hour = value.seconds // 3600
-            minute = (value.seconds % 3600) // 60
-            second = value.seconds % 60
-            hour_text = f'{hour}H' if hour > 0 else ''
-            minute_text = f'{minute}M' if minute > 0 else ''
-            second_text = f'{second}S' if second > 0 else ''
-            return str(f"{'-' if value.days < 0 else ''}P{abs(value.days)}DT{hour_text}{minute_text}{second_text}")
+        days = value.days
+        hour, rest = divmod(value.seconds, 3600)
+        minute, second = divmod(rest, 60)
+        if days == 0 and value.microseconds == 0:
+            # 与str(value)一致（H:MM:SS），不再先转字符串判断长度
+            return f'{hour}:{minute:02d}:{second:02d}'
+        parts = ['-P' if days < 0 else 'P', str(abs(days)), 'DT']
+        if hour:
+            parts.append(f'{hour}H')
+        if minute:
+            parts.append(f'{minute}M')
+        if second:
+            parts.append(f'{second}S')
+        return ''.join(parts)
 
 
 class UuidSerializer(Serializer):
@@ -542,7 +639,9 @@ class UuidSerializer(Serializer):
 
     @classmethod
     def uncheck_serialize(cls, value, parameter: SerParameter) -> str:
-        return str(value)
+        # bytes.hex在C中完成，比UUID.__str__中的 % 格式化更快，再按标准格式插入连字符
+        hex_value = value.bytes.hex()
+        return f'{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-{hex_value[16:20]}-{hex_value[20:]}'
 
 
 class EnumSerializer(Serializer):
@@ -552,18 +651,26 @@ class EnumSerializer(Serializer):
     annotation = enum.Enum
     enum_class: enum.EnumType
     use_value: bool
+    """成员到序列化结果的映射"""
+    serialized_values: Dict[enum.Enum, Any]
 
     def __init__(self, enum_class: enum.EnumType, use_value: bool = True, **kwargs):
         super().__init__(**kwargs)
         self.enum_class = enum_class
         self.use_value = use_value
         self.values = [i.value if self.use_value else i.name for i in self.enum_class]
+        # 值为基本类型的成员，序列化结果即其值，构建时预先算好
+        self.serialized_values = {member: member.value for member in self.enum_class
+                                  if type(member.value) in _PRIMITIVE_JSON_TYPES}
 
     def to_python(self, value, parameter: SerParameter) -> enum.Enum:
         return super().to_python(value, parameter)
 
     def serialize(self, value, parameter: SerParameter) -> Any:
-        if isinstance(value, self.annotation):
+        if is_enum_instance(value):
+            serialized_value = self.serialized_values.get(value, MISSING)
+            if serialized_value is not MISSING:
+                return serialized_value
             return self.uncheck_serialize(value, parameter)
         return serialize_any_to_python(value, parameter)
 
@@ -587,18 +694,24 @@ class IntEnumSerializer(Serializer):
     annotation = enum.IntEnum
     enum_class: enum.EnumType
     use_value: bool
+    """成员到序列化结果的映射"""
+    serialized_values: Dict[enum.Enum, Any]
 
     def __init__(self, enum_class: enum.EnumType, use_value: bool = True, **kwargs):
         super().__init__(**kwargs)
         self.enum_class = enum_class
         self.use_value = use_value
         self.values = [i.value if self.use_value else i.name for i in self.enum_class]
+        self.serialized_values = {member: int(member.value) for member in self.enum_class}
 
     def to_python(self, value, parameter: SerParameter) -> enum.IntEnum:
         return super().to_python(value, parameter)
 
     def serialize(self, value, parameter: SerParameter) -> int:
         if isinstance(value, self.annotation):
+            serialized_value = self.serialized_values.get(value, MISSING)
+            if serialized_value is not MISSING:
+                return serialized_value
             return self.uncheck_serialize(value, parameter)
         return serialize_any_to_python(value, parameter)
 
@@ -621,23 +734,42 @@ class UnionSerializer(Serializer):
     serializer_name = 'union'
     annotation = Union
     serializers: List[Serializer]
+    """值的精确类型到成员无检查序列化方法的表，命中时无需按顺序逐个尝试成员"""
+    serialize_fns_by_type: Dict[type, Callable[[Any, SerParameter], Any]]
 
     def __init__(self, serializers: List[Serializer], **kwargs):
         super().__init__(**kwargs)
         self.serializers = serializers
+        self.serialize_fns_by_type = {}
+        # 只收录按注解类型检查的简单成员（如int、str），且之前的成员都不接受该类型，保持按顺序匹配的结果不变；
+        # 遇到自定义检查逻辑的成员后无法判断其接受的类型，停止收录
+        accepted_types: tuple = ()
+        for serializer in serializers:
+            annotation = serializer.annotation
+            if type(serializer).serialize is not Serializer.serialize or not isinstance(annotation, type):
+                break
+            if not issubclass(annotation, accepted_types):
+                self.serialize_fns_by_type.setdefault(annotation, serializer.uncheck_serialize)
+            accepted_types += (annotation,)
 
     def to_python(self, value, parameter: SerParameter) -> Any:
         return super().to_python(value, parameter)
 
     def serialize(self, value, parameter: SerParameter) -> Any:
-        new_ser_parameter = copy.copy(parameter)
-        new_ser_parameter.check = SerCheck.ENABLED
-
-        for serializer in self.serializers:
-            try:
-                return serializer.serialize(value, new_ser_parameter)
-            except SerializationValueError:
-                pass
+        serialize_fn = self.serialize_fns_by_type.get(type(value))
+        if serialize_fn is not None:
+            return serialize_fn(value, parameter)
+        # 只有check不同，原地开启检查并在结束后恢复，不再复制序列化参数
+        check = parameter.check
+        parameter.check = SerCheck.ENABLED
+        try:
+            for serializer in self.serializers:
+                try:
+                    return serializer.serialize(value, parameter)
+                except SerializationValueError:
+                    pass
+        finally:
+            parameter.check = check
         return serialize_any_to_python(value, parameter, self.name)
 
     @classmethod
@@ -669,18 +801,34 @@ class LiteralSerializer(Serializer):
     serializer_name = 'literal'
     annotation = Literal
     expected_values: Tuple[Any, ...]
+    """可哈希的字面量集合，用于O(1)查找，存在不可哈希字面量时为空"""
+    expected_set: optional[frozenset]
 
     def __init__(self, *expected: Tuple[Any, ...], **kwargs):
         super().__init__(**kwargs)
         self.expected_values = expected
+        try:
+            self.expected_set = frozenset(expected)
+        except TypeError:
+            self.expected_set = None
+
+    def is_expected(self, value) -> bool:
+        """与LiteralValidator的判断一致"""
+        if self.expected_set is None:
+            return value in self.expected_values
+        try:
+            return value in self.expected_set
+        except TypeError:
+            # 不可哈希的值不可能等于任何可哈希字面量
+            return False
 
     def to_python(self, value, parameter: SerParameter) -> Union[int, str, bool, Any]:
-        if value in self.expected_values:
+        if self.is_expected(value):
             return self.uncheck_to_python(value, parameter)
         return serialize_any_to_python(value, parameter, self.name)
 
     def serialize(self, value, parameter: SerParameter) -> Union[int, str, bool, Any]:
-        if value in self.expected_values:
+        if self.is_expected(value):
             return self.uncheck_serialize(value, parameter)
         return serialize_any_to_json_value(value, parameter, self.name)
 
@@ -711,31 +859,40 @@ class DictSerializer(Serializer):
     annotation = dict
     key_serializer: Serializer
     value_serializer: Serializer
+    """键/值序列化器原样返回时的类型"""
+    key_exact_type: optional[type]
+    value_exact_type: optional[type]
 
     def __init__(self, key_serializer: Serializer, value_serializer: Serializer, **kwargs):
         super().__init__(**kwargs)
         self.key_serializer = key_serializer
         self.value_serializer = value_serializer
+        self.key_exact_type = passthrough_type(key_serializer)
+        self.value_exact_type = passthrough_type(value_serializer)
+
+    def serialize_items(self, value: dict, parameter: SerParameter, serialize_key: Callable,
+                        serialize_value: Callable) -> dict:
+        """按键/值是否可原样返回选择对应的循环，都可原样返回时直接复制"""
+        if is_exact_items(value, self.key_exact_type):
+            if is_exact_items(value.values(), self.value_exact_type):
+                return dict(value)
+            return {key: serialize_value(dict_value, parameter) for key, dict_value in value.items()}
+        if is_exact_items(value.values(), self.value_exact_type):
+            return {serialize_key(key, parameter): dict_value for key, dict_value in value.items()}
+        return {serialize_key(key, parameter): serialize_value(dict_value, parameter)
+                for key, dict_value in value.items()}
 
     def to_python(self, value, parameter: SerParameter) -> dict:
-        if not isinstance_safe(value, self.annotation):
+        if type(value) is not self.annotation and not isinstance_safe(value, self.annotation):
             return serialize_any_to_python(value, parameter, self.name)
-        out_dict = dict()
-        for key, dict_value in value.items():
-            key_value = self.value_serializer.to_python(key, parameter)
-            serialize_value = self.value_serializer.to_python(dict_value, parameter)
-            out_dict[key_value] = serialize_value
-        return out_dict
+        return self.serialize_items(value, parameter, self.key_serializer.to_python,
+                                    self.value_serializer.to_python)
 
     def serialize(self, value, parameter: SerParameter) -> dict:
-        if not isinstance_safe(value, self.annotation):
+        if type(value) is not self.annotation and not isinstance_safe(value, self.annotation):
             return serialize_any_to_json_value(value, parameter, self.name)
-        out_dict = dict()
-        for key, dict_value in value.items():
-            key_value = self.key_serializer.serialize(key, parameter)
-            serialize_value = self.value_serializer.serialize(dict_value, parameter)
-            out_dict[key_value] = serialize_value
-        return out_dict
+        return self.serialize_items(value, parameter, self.key_serializer.serialize,
+                                    self.value_serializer.serialize)
 
     @classmethod
     def uncheck_to_python(cls, value, parameter: SerParameter) -> dict:
@@ -776,16 +933,27 @@ class ListSerializer(Serializer):
     serializer_name = 'list'
     annotation = list
     item_serializer: Serializer
+    """元素序列化器原样返回时的类型"""
+    item_exact_type: optional[type]
 
     def __init__(self, item_serializer: Serializer, **kwargs):
         super().__init__(**kwargs)
         self.item_serializer = item_serializer
+        self.item_exact_type = passthrough_type(item_serializer)
 
     def to_python(self, value, parameter: SerParameter) -> list:
-        return [self.item_serializer.to_python(item, parameter) for item in value]
+        if is_numpy_array(value):
+            value = value.tolist()
+        if is_exact_items(value, self.item_exact_type):
+            return list(value)
+        return list(map(self.item_serializer.to_python, value, repeat(parameter)))
 
     def serialize(self, value, parameter: SerParameter) -> list:
-        return [self.item_serializer.serialize(item, parameter) for item in value]
+        if is_numpy_array(value):
+            value = value.tolist()
+        if is_exact_items(value, self.item_exact_type):
+            return list(value)
+        return list(map(self.item_serializer.serialize, value, repeat(parameter)))
 
     @classmethod
     def uncheck_to_python(cls, value, parameter: SerParameter) -> list:
@@ -809,16 +977,23 @@ class SetSerializer(Serializer):
     serializer_name = 'set'
     annotation = set
     item_serializer: Serializer
+    """元素序列化器原样返回时的类型"""
+    item_exact_type: optional[type]
 
     def __init__(self, item_serializer: Serializer, **kwargs):
         super().__init__(**kwargs)
         self.item_serializer = item_serializer
+        self.item_exact_type = passthrough_type(item_serializer)
 
     def to_python(self, value, parameter: SerParameter) -> set:
-        return set((self.item_serializer.to_python(item, parameter) for item in value))
+        if is_exact_items(value, self.item_exact_type):
+            return set(value)
+        return set(map(self.item_serializer.to_python, value, repeat(parameter)))
 
     def serialize(self, value, parameter: SerParameter) -> list:
-        return [self.item_serializer.serialize(item, parameter) for item in value]
+        if is_exact_items(value, self.item_exact_type):
+            return list(value)
+        return list(map(self.item_serializer.serialize, value, repeat(parameter)))
 
     @classmethod
     def uncheck_to_python(cls, value, parameter: SerParameter) -> set:
@@ -835,16 +1010,23 @@ class FrozenSetSerializer(Serializer):
     serializer_name = 'frozenset'
     annotation = frozenset
     item_serializer: Serializer
+    """元素序列化器原样返回时的类型"""
+    item_exact_type: optional[type]
 
     def __init__(self, item_serializer: Serializer, **kwargs):
         super().__init__(**kwargs)
         self.item_serializer = item_serializer
+        self.item_exact_type = passthrough_type(item_serializer)
 
     def to_python(self, value, parameter: SerParameter) -> frozenset:
-        return frozenset((self.item_serializer.to_python(item, parameter) for item in value))
+        if is_exact_items(value, self.item_exact_type):
+            return frozenset(value)
+        return frozenset(map(self.item_serializer.to_python, value, repeat(parameter)))
 
     def serialize(self, value, parameter: SerParameter) -> list:
-        return [self.item_serializer.serialize(item, parameter) for item in value]
+        if is_exact_items(value, self.item_exact_type):
+            return list(value)
+        return list(map(self.item_serializer.serialize, value, repeat(parameter)))
 
     @classmethod
     def uncheck_to_python(cls, value, parameter: SerParameter) -> frozenset:
@@ -860,48 +1042,46 @@ class TupleSerializer(Serializer):
 
     serializer_name = 'tuple'
     annotation = tuple
-    serializers: List[Serializer]
+    serializers: Tuple[Serializer, ...]
+    """按位置预先绑定的子序列化器方法，避免每个元素重复查找属性"""
+    item_to_python_fns: Tuple[Callable[[Any, SerParameter], Any], ...]
+    item_serialize_fns: Tuple[Callable[[Any, SerParameter], Any], ...]
     variadic: bool = True
     accept_annotations: tuple = (tuple, list, set, frozenset)
 
     def __init__(self, serializers: List[Serializer], variadic: bool = False, **kwargs):
         super().__init__(**kwargs)
-        self.serializers = serializers
+        self.serializers = tuple(serializers)
+        self.item_to_python_fns = tuple(serializer.to_python for serializer in self.serializers)
+        self.item_serialize_fns = tuple(serializer.serialize for serializer in self.serializers)
         self.variadic = variadic
 
     def to_python(self, value, parameter: SerParameter) -> tuple:
         if not isinstance_safe(value, self.accept_annotations):
             return serialize_any_to_python(value, parameter, self.name)
         self.check_variadic(value, parameter)
-        out_list: list = []
         if not self.variadic:
-            for index, item_value in enumerate(value):
-                try:
-                    serialize_value = self.serializers[index].to_python(item_value, parameter)
-                except IndexError:
-                    serialize_value = serialize_any_to_python(item_value, parameter)
-                out_list.append(serialize_value)
+            # 与序列化器一一对应的元素按位置序列化，多出的元素（共用同一个迭代器）按任意类型序列化
+            items = iter(value)
+            out_list: list = [to_python(item_value, parameter)
+                              for to_python, item_value in zip(self.item_to_python_fns, items)]
+            out_list.extend(serialize_any_to_python(item_value, parameter) for item_value in items)
             return tuple(out_list)
         # 可变
-        serializer = self.serializers[0]
-        return tuple(serializer.to_python(value, parameter) for value in value)
+        return tuple(map(self.item_to_python_fns[0], value, repeat(parameter)))
 
     def serialize(self, value, parameter: SerParameter) -> list:
         if not isinstance_safe(value, self.accept_annotations):
             return serialize_any_to_python(value, parameter, self.name)
         self.check_variadic(value, parameter)
-        out_list: list = []
         if not self.variadic:
-            for index, item_value in enumerate(value):
-                try:
-                    serialize_value = self.serializers[index].serialize(item_value, parameter)
-                except IndexError:
-                    serialize_value = serialize_any_to_json_value(item_value, parameter)
-                out_list.append(serialize_value)
+            items = iter(value)
+            out_list: list = [serialize(item_value, parameter)
+                              for serialize, item_value in zip(self.item_serialize_fns, items)]
+            out_list.extend(serialize_any_to_json_value(item_value, parameter) for item_value in items)
             return out_list
         # 可变
-        serializer = self.serializers[0]
-        return [serializer.serialize(value, parameter) for value in value]
+        return list(map(self.item_serialize_fns[0], value, repeat(parameter)))
 
     @classmethod
     def uncheck_to_python(cls, value, parameter: SerParameter) -> tuple:
@@ -946,20 +1126,28 @@ class OptionalSerializer(Serializer):
     serializer_name = 'optional'
     annotation = Optional
     serializer: Serializer
+    """内部序列化器原样返回时的类型"""
+    exact_type: optional[type]
+    """预先绑定的内部序列化方法"""
+    inner_to_python: Callable[[Any, SerParameter], Any]
+    inner_serialize: Callable[[Any, SerParameter], Any]
 
     def __init__(self, serializer: Serializer, **kwargs):
         super().__init__(**kwargs)
         self.serializer = serializer
+        self.exact_type = passthrough_type(serializer)
+        self.inner_to_python = serializer.to_python
+        self.inner_serialize = serializer.serialize
 
     def to_python(self, value, parameter: SerParameter) -> Optional[Any]:
-        if value is None:
+        if value is None or type(value) is self.exact_type:
             return value
-        return self.serializer.to_python(value, parameter)
+        return self.inner_to_python(value, parameter)
 
     def serialize(self, value, parameter: SerParameter) -> Optional[Any]:
-        if value is None:
+        if value is None or type(value) is self.exact_type:
             return value
-        return self.serializer.serialize(value, parameter)
+        return self.inner_serialize(value, parameter)
 
     @classmethod
     def uncheck_to_python(cls, value, parameter: SerParameter):
@@ -983,18 +1171,12 @@ class GeneratorSerializer(Serializer):
     serializer_name = 'generator'
     annotation = Generator
 
-    def to_python(self, value, parameter: SerParameter) -> uuid.UUID:
-        return super().to_python(value, parameter)
-
     def serialize(self, value, parameter: SerParameter) -> str:
-        if isinstance(value, self.annotation):
-            return self.uncheck_serialize(value, parameter)
+        # 原生生成器直接判断类型，避免typing.Generator走抽象基类的isinstance检查
+        if type(value) is GeneratorType or isinstance(value, self.annotation):
+            return str(value)
         return serialize_any_to_python(value, parameter)
 
-    @classmethod
-    def uncheck_to_python(cls, value, parameter: SerParameter) -> uuid.UUID:
-        return super().uncheck_to_python(value, parameter)
-
     @classmethod
     def uncheck_serialize(cls, value, parameter: SerParameter) -> str:
         return str(value)
@@ -1043,8 +1225,12 @@ MATCH_SERIALIZERS: dict = {
     collections.abc.Generator: GeneratorSerializer,
 }
 
+"""按值类型预先取出的无检查序列化方法，任意类型序列化时一次字典查找即可分派"""
+_UNCHECK_TO_PYTHON_FNS: dict = {k: v.uncheck_to_python for k, v in MATCH_SERIALIZERS.items()}
+_UNCHECK_SERIALIZE_FNS: dict = {k: v.uncheck_serialize for k, v in MATCH_SERIALIZERS.items()}
+
 
-def matching_serializer(annotation, **kwargs):
+def _matching_serializer(annotation, **kwargs):
     """匹配序列化器"""
     origin_annotation = type_parser.get_origin_safe(annotation) or annotation
     # 如何未指定kwargs尝试在全局序列化器中查找（省内存）
@@ -1057,30 +1243,51 @@ def matching_serializer(annotation, **kwargs):
         return MATCH_SERIALIZERS[origin_annotation].build(annotation, **kwargs)
     except KeyError:
         # 特殊注解
-        if issubclass_safe(annotation, enum.IntEnum):
-            return MATCH_SERIALIZERS[enum.IntEnum].build(annotation, **kwargs)
-        elif issubclass_safe(annotation, enum.Enum):
+        if is_enum_class(annotation):
+            if issubclass(annotation, enum.IntEnum):
+                return MATCH_SERIALIZERS[enum.IntEnum].build(annotation, **kwargs)
             return MATCH_SERIALIZERS[enum.Enum].build(annotation, **kwargs)
     raise SerializerBuildingError(f'无法为 {annotation} 类型构建序列化器')
 
 
+@functools.lru_cache(maxsize=512)
+def _cached_matching_serializer(annotation_id: int, annotation, kwargs_items: tuple) -> Serializer:
+    return _matching_serializer(annotation, **dict(kwargs_items))
+
+
+def matching_serializer(annotation, **kwargs) -> Serializer:
+    """
+    带缓存的匹配序列化器，容器序列化器构建时递归调用，相同注解与参数（如多个字段的List[int]）共用同一个序列化器。
+    以注解的id区分相等但不同的注解（如Union[int, str]与Union[str, int]的匹配顺序不同），参数不可哈希时不缓存。
+    """
+    if not kwargs:
+        # 未指定kwargs的普通类直接取全局序列化器
+        serializer = GLOBAL_SERIALIZERS.get(annotation) if type(annotation) is type else None
+        if serializer is not None:
+            return serializer
+        kwargs_items = ()
+    else:
+        kwargs_items = tuple(sorted(kwargs.items()))
+    try:
+        hash((annotation, kwargs_items))
+    except TypeError:
+        return _matching_serializer(annotation, **kwargs)
+    return _cached_matching_serializer(id(annotation), annotation, kwargs_items)
+
+
 def serialize_any_to_python(value, parameter: SerParameter, expect_type: Union[type, str] = None) -> Any:
     """序列化任意数据到python对象"""
-    if expect_type:
+    if expect_type is not None:
         parameter.on_fallback(expect_type, value, type(value))
-    try:
-        return MATCH_SERIALIZERS[type(value)].uncheck_to_python(value, parameter)
-    except KeyError:
-        # errs
-        return value
+    # 未知类型原样返回
+    fn = _UNCHECK_TO_PYTHON_FNS.get(type(value))
+    return value if fn is None else fn(value, parameter)
 
 
 def serialize_any_to_json_value(value, parameter: SerParameter, expect_type: Union[type, str] = None) -> Any:
     """序列化任意数据到任意语言可理解对象，并且可解析到json输出到文件"""
-    if expect_type:
+    if expect_type is not None:
         parameter.on_fallback(expect_type, value, type(value))
-    try:
-        return MATCH_SERIALIZERS[type(value)].uncheck_serialize(value, parameter)
-    except KeyError:
-        # errs
-        return value
\ No newline at end of file
+    # 未知类型原样返回
+    fn = _UNCHECK_SERIALIZE_FNS.get(type(value))
+    return value if fn is None else fn(value, parameter)
\ No newline at end of file
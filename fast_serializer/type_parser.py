@@ -1,5 +1,6 @@
 # -*- coding:utf-8 -*-
-import collections
+import collections.abc
+import functools
 from types import FunctionType
 from typing import (
     Optional,
@@ -21,6 +22,111 @@ from typing import (
 from .constants import _DATACLASS_FIELDS_NAME
 from .utils import isinstance_safe, issubclass_safe
 
+"""注解原型分类标志位"""
+COLLECTION = 1 << 0
+ITERABLE = 1 << 1
+LIST = 1 << 2
+TUPLE = 1 << 3
+SET = 1 << 4
+MAPPING = 1 << 5
+DICT = 1 << 6
+SEQUENCE = 1 << 7
+COUNTER = 1 << 8
+
+"""分类标志位对应的typing基类"""
+_FLAG_BASES = (
+    (COLLECTION, Collection),
+    (ITERABLE, Iterable),
+    (LIST, List),
+    (TUPLE, Tuple),
+    (SET, Set),
+    (MAPPING, Mapping),
+    (DICT, Dict),
+    (SEQUENCE, Sequence),
+    (COUNTER, Counter),
+)
+
+
+def _compute_origin_flags(origin) -> int:
+    flags = 0
+    for flag, base in _FLAG_BASES:
+        if issubclass_safe(origin, base):
+            flags |= flag
+    return flags
+
+
+"""原型到分类标志位的表，常见容器导入时预先计算，其余原型首次分类时补充"""
+_ORIGIN_FLAGS: dict = {
+    origin: _compute_origin_flags(origin) for origin in (
+        list, tuple, set, frozenset, dict, collections.Counter, collections.deque, collections.defaultdict,
+        collections.OrderedDict, collections.abc.Collection, collections.abc.Iterable, collections.abc.Sequence,
+        collections.abc.MutableSequence, collections.abc.Mapping, collections.abc.MutableMapping,
+        collections.abc.Set, collections.abc.MutableSet,
+    )
+}
+
+
+"""特殊注解种类标志位"""
+KIND_OPTIONAL = 1 << 0
+KIND_UNION = 1 << 1
+KIND_LITERAL = 1 << 2
+KIND_FINAL = 1 << 3
+KIND_CLASS_VAR = 1 << 4
+
+"""原型的_name到特殊注解种类的表"""
+_ORIGIN_NAME_KINDS: dict = {
+    'Union': KIND_UNION,
+    'Literal': KIND_LITERAL,
+    'Final': KIND_FINAL,
+    'ClassVar': KIND_CLASS_VAR,
+}
+
+
+def _compute_kind(annotation) -> int:
+    origin = get_origin(annotation)
+    origin_name = getattr(origin, '_name', None)
+    kind = _ORIGIN_NAME_KINDS.get(origin_name, 0) if isinstance(origin_name, str) else 0
+    if origin is Union:
+        kind |= KIND_UNION
+    elif origin is Literal:
+        kind |= KIND_LITERAL
+    if annotation is Optional or annotation is Any or getattr(annotation, '_name', None) == 'Optional':
+        kind |= KIND_OPTIONAL
+    if annotation is Final:
+        kind |= KIND_FINAL
+    elif annotation is ClassVar:
+        kind |= KIND_CLASS_VAR
+    return kind
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_kind(annotation_id: int, annotation) -> int:
+    return _compute_kind(annotation)
+
+
+def _kind(annotation) -> int:
+    """
+    一次计算注解的全部特殊种类（按注解缓存），注解不可哈希时直接计算。
+    以注解的id区分相等但不同的注解（如int | None与Optional[int]相等，原型却不同）。
+    """
+    try:
+        return _cached_kind(id(annotation), annotation)
+    except TypeError:
+        return _compute_kind(annotation)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_get_origin(annotation_id: int, annotation):
+    return get_origin(annotation)
+
+
+def _get_origin(annotation):
+    """按注解（id）缓存get_origin的结果，注解不可哈希时直接计算"""
+    try:
+        return _cached_get_origin(id(annotation), annotation)
+    except TypeError:
+        return get_origin(annotation)
+
 
 class TypeParser:
     """类型解析器"""
@@ -41,7 +147,7 @@ class TypeParser:
         """是否可为空"""
         if annotation is None:
             return False
-        return annotation is Optional or getattr(annotation, '_name', None) == 'Optional' or annotation is Any
+        return bool(_kind(annotation) & KIND_OPTIONAL)
 
     def is_no_return(self, annotation) -> bool:
         """是否为不返回类型"""
@@ -53,32 +159,44 @@ class TypeParser:
         """是否联合类型的"""
         if annotation is None:
             return False
-        return get_origin(annotation) is Union or getattr(get_origin(annotation), '_name', None) == 'Union'
+        return bool(_kind(annotation) & KIND_UNION)
 
     def is_literal(self, annotation) -> bool:
         """是否字面量类型的"""
         if annotation is None:
             return False
-        origin = get_origin(annotation)
-        return origin is Literal or getattr(origin, '_name', None) == 'Literal'
+        return bool(_kind(annotation) & KIND_LITERAL)
 
     def is_final(self, value) -> bool:
         """是否最后类型的"""
         if value is None:
             return False
-        return value is Final or getattr(get_origin(value), '_name', None) == 'Final'
+        return bool(_kind(value) & KIND_FINAL)
 
     def is_class_var(self, value) -> bool:
         """是否为类共享类型的"""
         if value is None:
             return False
-        return value is ClassVar or getattr(get_origin(value), '_name', None) == 'ClassVar'
+        return bool(_kind(value) & KIND_CLASS_VAR)
+
+    def classify(self, annotation) -> int:
+        """按注解原型分类，返回分类标志位（如LIST | SEQUENCE），非泛型容器注解返回0"""
+        origin = _get_origin(annotation)
+        if origin is None:
+            return 0
+        try:
+            return _ORIGIN_FLAGS[origin]
+        except KeyError:
+            flags = _ORIGIN_FLAGS[origin] = _compute_origin_flags(origin)
+            return flags
+        except TypeError:
+            return _compute_origin_flags(origin)
 
     def is_collection(self, value) -> bool:
         """是否集合类型的"""
         if value is None:
             return False
-        return issubclass_safe(get_origin(value), Collection)
+        return bool(self.classify(value) & COLLECTION)
 
     def is_deque(self, value) -> bool:
         """是否双端队列类型的"""
@@ -90,49 +208,49 @@ class TypeParser:
         """是否可迭代类型的"""
         if value is None:
             return False
-        return value is Iterable or issubclass_safe(get_origin(value), Iterable)
+        return value is Iterable or bool(self.classify(value) & ITERABLE)
 
     def is_list(self, value) -> bool:
         """是否列表类型的"""
         if value is None:
             return False
-        return isinstance_safe(value, list) or issubclass_safe(get_origin(value), List)
+        return isinstance_safe(value, list) or bool(self.classify(value) & LIST)
 
     def is_tuple(self, value) -> bool:
         """是否元组类型的"""
         if value is None:
             return False
-        return isinstance_safe(value, tuple) or issubclass_safe(get_origin(value), Tuple)
+        return isinstance_safe(value, tuple) or bool(self.classify(value) & TUPLE)
 
     def is_set(self, value) -> bool:
         """是否集合类型的"""
         if value is None:
             return False
-        return isinstance_safe(value, set) or issubclass_safe(get_origin(value), Set)
+        return isinstance_safe(value, set) or bool(self.classify(value) & SET)
 
     def is_mapping(self, value) -> bool:
         """是否映射类型的"""
         if value is None:
             return False
-        return issubclass_safe(get_origin(value), Mapping)
+        return bool(self.classify(value) & MAPPING)
 
     def is_dict(self, value) -> bool:
         """是否字典类型的"""
         if value is None:
             return False
-        return value is Dict or isinstance_safe(value, dict) or issubclass_safe(get_origin(value), Dict)
+        return value is Dict or isinstance_safe(value, dict) or bool(self.classify(value) & DICT)
 
     def is_sequence(self, value) -> bool:
         """是否序列类型的"""
         if value is None:
             return False
-        return issubclass_safe(get_origin(value), Sequence)
+        return bool(self.classify(value) & SEQUENCE)
 
     def is_counter(self, value) -> bool:
         """是否计数器类型的"""
         if value is None:
             return False
-        return issubclass_safe(get_origin(value), Counter)
+        return bool(self.classify(value) & COUNTER)
 
     def is_function(self, value) -> bool:
         """是否为函数"""
@@ -147,14 +265,14 @@ class TypeParser:
         return hasattr(value, 'model_fields') and hasattr(value, '__pydantic_validator__')
 
     def get_origin_safe(self, v):
-        return get_origin(v)
+        return _get_origin(v)
 
     def repair_type(self, value):
         """检查类型是否合法，并修正"""
         if value in self.__required_subtype_types__:
             raise RuntimeError(f"{value} 必须包含子类型")
         elif value in self.__hope_subtype_types__:
-            return get_origin(self.__hope_subtype_types__[self.__hope_subtype_types__.index(value)])
+            return _get_origin(self.__hope_subtype_types__[self.__hope_subtype_types__.index(value)])
         return value
 
 
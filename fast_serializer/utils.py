@@ -1,16 +1,23 @@
 # -*- coding:utf-8 -*-
-import _thread
+import builtins
+import contextvars
+import enum
 import functools
 from typing import Union
 from .constants import _SUB_VALIDATOR_KWARGS_NAME, _SUB_SERIALIZER_KWARGS_NAME
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def fast_dataclass_repr(fast_dataclass, join_str: str):
     return join_str.join(repr(v) if a is None else f'{a}={v!r}' for a, v in fast_dataclass_repr_values(fast_dataclass))
 
 
 def fast_dataclass_repr_values(fast_dataclass):
-    for k, v in __dict__.items():
+    for k, v in fast_dataclass.__dict__.items():
         field = fast_dataclass.dataclass_fields.get(k)
         if field and field.repr:
             yield k, v
@@ -20,18 +27,22 @@ def fast_dataclass_repr_values(fast_dataclass):
 def _recursive_repr(user_function):
     # Decorator to make a repr function return "..." for a recursive
     # call.
-    repr_running = set()
+    # 正在执行的repr按上下文（线程）各自记录，只需以id(self)为键，不再共享一个跨线程的集合；
+    # 复制的上下文共享同一个值，因此值为不可变集合，每层repr设置新集合并在结束后恢复
+    repr_running: contextvars.ContextVar[frozenset] = contextvars.ContextVar(
+        f'repr_running_{user_function.__qualname__}', default=frozenset())
 
     @functools.wraps(user_function)
     def wrapper(self):
-        key = id(self), _thread.get_ident()
-        if key in repr_running:
+        running = repr_running.get()
+        key = id(self)
+        if key in running:
             return '...'
-        repr_running.add(key)
+        token = repr_running.set(running | {key})
         try:
             result = user_function(self)
         finally:
-            repr_running.discard(key)
+            repr_running.reset(token)
         return result
 
     return wrapper
@@ -50,6 +61,32 @@ def _format_type(_type) -> str:
     return type_str
 
 
+def _create_fn(name, args, body, *, _globals=None, _locals=None, return_type=None):
+    # Note that we mutate locals when exec() is called.  Caller
+    # beware!  The only callers are internal to this package, so no
+    # worries about external callers.
+    if _locals is None:
+        _locals = {}
+    if 'BUILTINS' not in _locals:
+        _locals['BUILTINS'] = builtins
+    return_annotation = ''
+    if return_type is not None:
+        _locals['_return_type'] = return_type
+        return_annotation = '->_return_type'
+    args = ','.join(args)
+    body = '\n'.join(f'  {b}' for b in body)
+
+    # Compute the text of the entire function.
+    txt = f' def {name}({args}){return_annotation}:\n{body}'
+
+    local_vars = ', '.join(_locals.keys())
+    txt = f"def __create_fn__({local_vars}):\n{txt}\n return {name}"
+
+    ns = {}
+    exec(txt, _globals, ns)
+    return ns['__create_fn__'](**_locals)
+
+
 def camel_to_snake(text: str) -> str:
     """驼峰转下划线"""
     return ''.join(['_' + i.lower() if i.isupper() else i for i in text]).lstrip('_')
@@ -69,12 +106,34 @@ def isinstance_safe(v, tp) -> bool:
 
 
 def issubclass_safe(v, tp) -> bool:
+    # 非泛型注解的get_origin结果为None，直接返回，避免抛出并捕获TypeError
+    if v is None:
+        return False
     try:
         return issubclass(v, tp)
     except TypeError:
         return False
 
 
+def is_numpy_array(v) -> bool:
+    """是否为numpy数组（未安装numpy时始终为False）"""
+    return numpy is not None and type(v) is numpy.ndarray
+
+
+"""枚举元类，用于快速判断枚举（避免issubclass遍历MRO）"""
+_ENUM_META = type(enum.Enum)
+
+
+def is_enum_class(tp) -> bool:
+    """是否为枚举类"""
+    return type(tp) is _ENUM_META or isinstance(tp, _ENUM_META)
+
+
+def is_enum_instance(v) -> bool:
+    """是否为枚举实例"""
+    return type(type(v)) is _ENUM_META or isinstance(type(v), _ENUM_META)
+
+
 def get_sub_validator_kwargs(validator_kwargs: Union[dict, list], index: int = 0) -> dict:
     try:
         sub_validator_kwargs = validator_kwargs[_SUB_VALIDATOR_KWARGS_NAME]
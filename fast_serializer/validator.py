@@ -3,6 +3,7 @@ import collections.abc
 import datetime
 import decimal
 import enum
+import functools
 import inspect
 import re
 import time
@@ -18,7 +19,14 @@ from .constants import _T, ArgsKwargs
 from .exceptions import DataclassCustomError, ErrorDetail, ValidationError, ValidatorBuildingError
 from .type_parser import type_parser
 from .types import optional
-from .utils import _format_type, get_sub_validator_kwargs, isinstance_safe, issubclass_safe
+from .utils import (_format_type, get_sub_validator_kwargs, isinstance_safe, issubclass_safe, is_enum_class,
+                    is_enum_instance, is_numpy_array)
+
+
+"""精确类型查找表，type(v)命中时为单次哈希查找，未命中再回退到isinstance以兼容子类"""
+_NUMBER_TYPES = frozenset({int, float, Decimal})
+_BUILTIN_COLLECTION_TYPES = frozenset({list, tuple, set, frozenset})
+_NOT_COLLECTION_TYPES = frozenset({str, bytes, bytearray, dict})
 
 
 class Validator(ABC):
@@ -26,6 +34,10 @@ class Validator(ABC):
 
     validator_name: str
     annotation: _T
+    """是否有约束（如长度限制），无约束时跳过检查"""
+    has_constraints: bool = False
+    """精确类型，输入值的类型与其完全相同时验证结果即为输入值本身，可跳过验证"""
+    exact_type: optional[type] = None
 
     def __init__(self, **kwargs): ...
 
@@ -59,6 +71,7 @@ class StringValidator(Validator):
 
     validator_name = 'str'
     annotation = str
+    exact_type = str
     allow_number: bool = True
     numbers_types = (int, float, decimal.Decimal)
 
@@ -69,11 +82,12 @@ class StringValidator(Validator):
     def validate(self, value, allow_number: optional[bool] = None) -> str:
         self.allow_number = self.allow_number if allow_number is None else allow_number
         maybe_str = self.maybe_str(value)
-        if maybe_str:
+        if maybe_str is not None:
             return maybe_str
         elif isinstance_safe(value, bytearray):
             return value.decode('utf-8')
-        if self.allow_number and isinstance_safe(value, self.numbers_types) and not isinstance_safe(value, bool):
+        if self.allow_number and (type(value) in _NUMBER_TYPES or (
+                isinstance_safe(value, self.numbers_types) and not isinstance_safe(value, bool))):
             return self.annotation(value)
         raise ValueError('输入应为有效字符串')
 
@@ -98,6 +112,7 @@ class BoolValidator(Validator):
 
     validator_name: str = 'bool'
     annotation = bool
+    exact_type = bool
 
     def validate(self, value) -> bool:
         if isinstance_safe(value, self.annotation):
@@ -132,6 +147,7 @@ class IntegerValidator(Validator):
 
     validator_name: str = 'int'
     annotation = int
+    exact_type = int
     half_adjust_value: float = 0.11
 
     def validate(self, value) -> int:
@@ -146,7 +162,7 @@ class IntegerValidator(Validator):
         if isinstance_safe(value, (float, Decimal)):
             return self.float_or_decimal_to_int(value)
         try:
-            if issubclass_safe(value, enum.Enum):
+            if is_enum_instance(value):
                 return self.enum_to_int(value)
         except (ValueError, TypeError):
             raise ValueError('输入应为有效整数')
@@ -177,6 +193,7 @@ class FloatValidator(Validator):
 
     validator_name: str = 'float'
     annotation = float
+    exact_type = float
 
     def validate(self, value) -> float:
         if isinstance_safe(value, self.annotation):
@@ -199,6 +216,7 @@ class DecimalValidator(FloatValidator):
 
     validator_name = 'decimal'
     annotation = Decimal
+    exact_type = Decimal
 
     def validate(self, value) -> Decimal:
         if isinstance_safe(value, self.annotation):
@@ -222,6 +240,7 @@ class BytesValidator(Validator):
 
     validator_name = 'bytes'
     annotation = bytes
+    exact_type = bytes
 
     def validate(self, value) -> bytes:
         if isinstance_safe(value, self.annotation):
@@ -241,6 +260,7 @@ class IsInstanceValidator(Validator):
     def __init__(self, annotation: _T, **kwargs):
         super().__init__(**kwargs)
         self.annotation = annotation
+        self.exact_type = annotation if isinstance(annotation, type) else None
 
     def validate(self, value):
         if isinstance_safe(value, self.annotation):
@@ -346,14 +366,28 @@ class LiteralValidator(Validator):
     validator_name = 'literal'
     annotation = Literal
     expected_values: Tuple[Any, ...]
+    """可哈希的字面量集合，用于O(1)查找，存在不可哈希字面量时为空"""
+    expected_set: optional[frozenset]
 
     def __init__(self, *expected: Tuple[Any, ...], **kwargs):
         super().__init__(**kwargs)
         self.expected_values = expected
+        try:
+            self.expected_set = frozenset(expected)
+        except TypeError:
+            self.expected_set = None
 
     def validate(self, value):
-        if value in self.expected_values:
-            return value
+        if self.expected_set is None:
+            if value in self.expected_values:
+                return value
+        else:
+            try:
+                if value in self.expected_set:
+                    return value
+            except TypeError:
+                # 不可哈希的输入不可能等于任何可哈希字面量
+                pass
         raise ValueError(f'输入应为 {self.format_expected_values}')
 
     @classmethod
@@ -464,13 +498,15 @@ class DictValidator(Validator):
         self.value_validator = value_validator
         self.min_length = min_length
         self.max_length = max_length
+        self.has_constraints = min_length is not None or max_length is not None
 
     def validate(self, value) -> dict:
         if not isinstance_safe(value, Mapping):
             raise DataclassCustomError('dict_type', '输入应为有效键值对')
         # 验证长度
         length: int = len(value)
-        check_collection_length(self.annotation, length, self.min_length, self.max_length)
+        if self.has_constraints:
+            check_collection_length(self.annotation, length, self.min_length, self.max_length)
         # 优化（双any可省略很多验证性能）
         key_validator_is_any = self.key_validator.annotation is Any
         value_validator_is_any = self.value_validator.annotation is Any
@@ -583,16 +619,24 @@ class ListValidator(Validator):
         self.item_validator = item_validator
         self.min_length = min_length
         self.max_length = max_length
+        self.has_constraints = min_length is not None or max_length is not None
 
     def validate(self, value) -> list:
         collection = extract_collection(value, 'list_type', '列表')
+        if is_numpy_array(collection):
+            # 在C层面一次性转为Python列表（元素为Python标量），之后可走元素类型精确匹配的快速路径
+            collection = collection.tolist()
         collection_length: int = len(collection)
         # 验证长度
-        check_collection_length(self.annotation, collection_length, self.min_length, self.max_length)
+        if self.has_constraints:
+            check_collection_length(self.annotation, collection_length, self.min_length, self.max_length)
         # 优化
         if self.item_validator.annotation is Any:
             is_list = isinstance_safe(collection, list)
             return collection if is_list else self.annotation(collection)
+        if is_exact_item_type(collection, self.item_validator):
+            # 元素无需逐个验证，但仍返回新列表，避免与调用方共享可变对象
+            return list(collection)
 
         errs: List[ErrorDetail] = []
         i: int
@@ -633,12 +677,14 @@ class TupleValidator(Validator):
         self.variadic = variadic
         self.min_length = min_length
         self.max_length = max_length
+        self.has_constraints = min_length is not None or max_length is not None
 
     def validate(self, value) -> tuple:
         collection = extract_collection(value, 'tuple_type', '元祖')
         # 检查长度
         length: int = len(collection)
-        check_collection_length(self.annotation, length, self.min_length, self.max_length)
+        if self.has_constraints:
+            check_collection_length(self.annotation, length, self.min_length, self.max_length)
         errs: List[ErrorDetail] = []
         # 不是无限延伸的元祖
         if not self.variadic:
@@ -655,6 +701,13 @@ class TupleValidator(Validator):
         else:
             # 可变
             validator = self.validators[0]
+            # 优化
+            if validator.annotation is Any:
+                is_tuple = isinstance_safe(collection, tuple)
+                return collection if is_tuple else self.annotation(collection)
+            if is_exact_item_type(collection, validator):
+                # 元素无需逐个验证，与逐个验证时一样返回新的元组
+                return tuple(collection)
             result: tuple = tuple(
                 validate_iter_with_catch(item, validator, [i], errs)
                 for i, item in enumerate(collection)
@@ -709,15 +762,20 @@ class SetValidator(Validator):
         self.item_validator = item_validator or BASE_VALIDATORS[Any]
         self.min_length = min_length
         self.max_length = max_length
+        self.has_constraints = min_length is not None or max_length is not None
 
     def validate(self, value) -> set:
         collection = extract_collection(value, 'set_type', '集合')
         # 检查长度
-        check_collection_length(self.annotation, len(collection), self.min_length, self.max_length)
+        if self.has_constraints:
+            check_collection_length(self.annotation, len(collection), self.min_length, self.max_length)
         # 优化
         if self.item_validator.annotation is Any:
             is_set = isinstance_safe(collection, self.annotation)
             return collection if is_set else self.annotation(collection)
+        if is_exact_item_type(collection, self.item_validator):
+            # 元素无需逐个验证，但仍返回新集合，避免与调用方共享可变对象
+            return set(collection)
         errs: List[ErrorDetail] = []
         result: set = {
             validate_iter_with_catch(item, self.item_validator, [i], errs)
@@ -754,15 +812,20 @@ class FrozenValidator(Validator):
         self.item_validator = item_validator
         self.min_length = min_length
         self.max_length = max_length
+        self.has_constraints = min_length is not None or max_length is not None
 
     def validate(self, value) -> frozenset:
         collection = extract_collection(value, 'frozenset_type', '冻结集合')
         # 检查长度
-        check_collection_length(self.annotation, len(collection), self.min_length, self.max_length)
+        if self.has_constraints:
+            check_collection_length(self.annotation, len(collection), self.min_length, self.max_length)
         # 优化
         if self.item_validator.annotation is Any:
             is_set = isinstance_safe(collection, self.annotation)
             return collection if is_set else self.annotation(collection)
+        if is_exact_item_type(collection, self.item_validator):
+            # 元素无需逐个验证，与逐个验证时一样返回新的冻结集合
+            return frozenset(collection)
         errs: List[ErrorDetail] = []
         result: frozenset = frozenset({
             validate_iter_with_catch(item, self.item_validator, [i], errs)
@@ -799,15 +862,20 @@ class DequeValidator(Validator):
         self.item_validator = item_validator
         self.min_length = min_length
         self.max_length = max_length
+        self.has_constraints = min_length is not None or max_length is not None
 
     def validate(self, value) -> collections.deque:
         collection = extract_collection(value, 'deque_type', '队列')
         # 检查长度
-        check_collection_length(self.annotation, len(collection), self.min_length, self.max_length)
+        if self.has_constraints:
+            check_collection_length(self.annotation, len(collection), self.min_length, self.max_length)
         # 优化
         if self.item_validator.annotation is Any:
             is_deque = isinstance_safe(collection, self.annotation)
             return collection if is_deque else self.annotation(collection)
+        if is_exact_item_type(collection, self.item_validator):
+            # 元素无需逐个验证，但仍返回新队列，避免与调用方共享可变对象
+            return collections.deque(collection)
         errs: List[ErrorDetail] = []
         result: collections.deque = collections.deque((
             validate_iter_with_catch(item, self.item_validator, [i], errs)
@@ -874,6 +942,7 @@ class GeneratorIterator:
     validator: Validator
     min_length: optional[int]
     max_length: optional[int]
+    has_constraints: bool
     index: int
 
     def __init__(self, iterable: Generator, validator: Validator, min_length: optional[int] = None,
@@ -882,6 +951,7 @@ class GeneratorIterator:
         self.validator = validator
         self.min_length = min_length
         self.max_length = max_length
+        self.has_constraints = min_length is not None or max_length is not None
         self.index = 0
 
     def __iter__(self):
@@ -892,10 +962,11 @@ class GeneratorIterator:
         errs: List[ErrorDetail] = []
         value = validate_iter_with_catch(value, self.validator, [self.index], errs)
         # 检查长度
-        try:
-            check_collection_length(Generator, self.index + 1, self.min_length, self.max_length)
-        except DataclassCustomError as e:
-            errs.append(ErrorDetail([self.index], value, e.exception_type, e.msg))
+        if self.has_constraints:
+            try:
+                check_collection_length(Generator, self.index + 1, self.min_length, self.max_length)
+            except DataclassCustomError as e:
+                errs.append(ErrorDetail([self.index], value, e.exception_type, e.msg))
         if errs:
             raise ValidationError(title=self.__class__.__name__, line_errors=errs)
         self.index += 1
@@ -915,14 +986,20 @@ class ParameterValidator:
     kind: Any
     default: Any
     validator: Validator
+    """是否可按位置传递（构建时计算，验证时不再比较参数类型）"""
+    positional: bool
+    """是否有默认值"""
+    has_default: bool
 
-    __slots__ = ('name', 'kind', 'default', 'validator')
+    __slots__ = ('name', 'kind', 'default', 'validator', 'positional', 'has_default')
 
     def __init__(self, name: str, kind: Any, default: Any, validator: Validator):
         self.name = name
         self.kind = kind
         self.default = default
         self.validator = validator
+        self.positional = kind is inspect.Parameter.POSITIONAL_OR_KEYWORD or kind is inspect.Parameter.POSITIONAL_ONLY
+        self.has_default = default is not inspect.Parameter.empty
 
     def __repr__(self):
         return f"{self.__class__.__name__}(name={self.name}, kind={self.kind}, default={self.default!r})"
@@ -935,6 +1012,8 @@ class FunctionValidator(Validator):
     annotation = FunctionType
     """参数验证器列表"""
     parameters: Dict[str, ParameterValidator]
+    """按顺序排列的参数名与参数验证器"""
+    parameter_items: Tuple[Tuple[str, ParameterValidator], ...]
     positional_params_count: int = 0
     var_positional_validator: optional[Validator]
     var_kwargs_validator: optional[Validator]
@@ -945,6 +1024,7 @@ class FunctionValidator(Validator):
                  var_kwargs_validator: optional[Validator] = None, **kwargs):
         super().__init__(**kwargs)
         self.parameters = parameters
+        self.parameter_items = tuple(parameters.items())
         # self.argument_validator = argument_validator
         self.function = function
         self.positional_params_count = positional_params_count
@@ -971,14 +1051,13 @@ class FunctionValidator(Validator):
         errs: List[ErrorDetail] = []
 
         # 循环所有参数
-        for index, param_name in enumerate(self.parameters):
-            parameter = self.parameters[param_name]
+        for index, (param_name, parameter) in enumerate(self.parameter_items):
             err = None
             pos_value = None
             kwargs_value = None
             try:
                 if args is not None:
-                    if parameter.kind in [inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.POSITIONAL_ONLY]:
+                    if parameter.positional:
                         pos_value = args[index]
                 if kwargs is not None:
                     kwargs_value = kwargs[parameter.name]
@@ -1000,30 +1079,30 @@ class FunctionValidator(Validator):
             elif pos_value is not None:
                 pos_value = validate_iter_with_catch(pos_value, parameter.validator, [index], errs)
                 validated_args.append(pos_value)
-            elif kwargs_value is not None and parameter.kind != inspect.Parameter.POSITIONAL_ONLY:
+            elif kwargs_value is not None and parameter.kind is not inspect.Parameter.POSITIONAL_ONLY:
                 kwargs_value = validate_iter_with_catch(kwargs_value, parameter.validator, [param_name], errs)
                 validated_kwargs[param_name] = kwargs_value
-            elif parameter.default == inspect.Parameter.empty:
-                if parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+            elif not parameter.has_default:
+                if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
                     if args:
                         # 验证*args参数
                         var_args: list = [validate_iter_with_catch(arg_value, self.var_positional_validator, [index], errs)
                                           for index, arg_value in enumerate(args[index:])]
                         validated_args.extend(var_args)
-                elif parameter.kind == inspect.Parameter.VAR_KEYWORD:
+                elif parameter.kind is inspect.Parameter.VAR_KEYWORD:
                     if kwargs:
                         # 验证**kwargs参数
                         var_kwargs: dict = {k: validate_iter_with_catch(v, self.var_kwargs_validator, [k], errs)
                                             for k, v in kwargs.items() if k not in used_kwargs}
                         validated_kwargs.update(var_kwargs)
-                elif parameter.kind == inspect.Parameter.KEYWORD_ONLY:
+                elif parameter.kind is inspect.Parameter.KEYWORD_ONLY:
                     errs.append(ErrorDetail(
                         [param_name],
                         value,
                         'missing_keyword_only',
                         '缺少必需的仅限关键字的参数'
                     ))
-                elif parameter.kind == inspect.Parameter.POSITIONAL_ONLY:
+                elif parameter.kind is inspect.Parameter.POSITIONAL_ONLY:
                     errs.append(ErrorDetail(
                         [param_name],
                         value,
@@ -1074,8 +1153,9 @@ class FunctionValidator(Validator):
             parameter = func_parameters[parameter_name]
             param_anno = parameter.annotation if parameter.annotation != inspect.Parameter.empty else Any
             validator = matching_validator(param_anno, **get_sub_validator_kwargs(kwargs, index))
-            parameters[parameter_name] = ParameterValidator(parameter.name, parameter.kind, parameter.default, validator)
-            if parameter.kind in [inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.POSITIONAL_ONLY]:
+            parameter_validator = ParameterValidator(parameter.name, parameter.kind, parameter.default, validator)
+            parameters[parameter_name] = parameter_validator
+            if parameter_validator.positional:
                 positional_params_count += 1
             if parameter.kind == inspect.Parameter.VAR_POSITIONAL:
                 var_positional_validator = validator
@@ -1105,6 +1185,7 @@ class DatetimeValidator(Validator):
 
     validator_name = 'datetime'
     annotation = datetime.datetime
+    exact_type = datetime.datetime
 
     """年长度"""
     year_length = len(StringValidator.annotation(datetime.MAXYEAR))
@@ -1120,6 +1201,8 @@ class DatetimeValidator(Validator):
     compare_timestamp = time.time()
     """时间戳长度"""
     timestamp_length = len(StringValidator.annotation(int(compare_timestamp)))
+    """毫秒级时间戳下限，位数超过秒级时间戳时视为毫秒级"""
+    millisecond_timestamp = 10 ** timestamp_length
 
     def validate(self, value) -> datetime.datetime:
         if isinstance_safe(value, self.annotation):
@@ -1145,7 +1228,7 @@ class DatetimeValidator(Validator):
     @classmethod
     def timestamp_to_datetime(cls, value: Union[int, float]) -> datetime.datetime:
         # 兼容毫秒级时间戳 下方为了兼容'1718245600000.0' 这种字符串带小数点的情况无法直接int
-        if len(str(int(float(value)))) > cls.timestamp_length:
+        if abs(float(value)) >= cls.millisecond_timestamp:
             value = value / 1000
         return datetime.datetime.fromtimestamp(value)
 
@@ -1181,7 +1264,7 @@ class DatetimeValidator(Validator):
             delimiter = cls.get_delimiter(value)
             __format = f'%Y{delimiter}%m{delimiter}%d'
             try:
-                return datetime.datetime.strptime(value, __format)
+                return cls.parse_fixed_datetime(value, delimiter) or datetime.datetime.strptime(value, __format)
             except (ValueError, TypeError):
                 raise DataclassCustomError('date_parsing', f'时间数据“{value}”与格式“{__format}”不匹配')
         elif length == cls.date_length + 5 and int_value:
@@ -1195,7 +1278,7 @@ class DatetimeValidator(Validator):
             delimiter = cls.get_delimiter(value)
             __format = f'%Y{delimiter}%m{delimiter}%d %H:%M'
             try:
-                return datetime.datetime.strptime(value, __format)
+                return cls.parse_fixed_datetime(value, delimiter) or datetime.datetime.strptime(value, __format)
             except (ValueError, TypeError):
                 raise DataclassCustomError(
                     'datetime_parsing',
@@ -1206,7 +1289,7 @@ class DatetimeValidator(Validator):
             delimiter = cls.get_delimiter(value)
             __format = f'%Y{delimiter}%m{delimiter}%d %H:%M:%S'
             try:
-                return datetime.datetime.strptime(value, __format)
+                return cls.parse_fixed_datetime(value, delimiter) or datetime.datetime.strptime(value, __format)
             except (ValueError, TypeError):
                 raise DataclassCustomError(
                     'datetime_parsing',
@@ -1227,12 +1310,36 @@ class DatetimeValidator(Validator):
     def get_delimiter(value: str):
         return '/' if '/' in value else '.' if '.' in value else '-'
 
+    @staticmethod
+    def parse_fixed_datetime(value: str, delimiter: str) -> optional[datetime.datetime]:
+        """
+        按固定位置切片解析`YYYY-MM-DD`、`YYYY-MM-DD HH:MM`、`YYYY-MM-DD HH:MM:SS`，避免strptime每次解析格式字符串。
+        不符合固定格式时返回None，由调用方回退到strptime。
+        """
+        length = len(value)
+        if value[4] != delimiter or value[7] != delimiter:
+            return None
+        if length > 10 and (value[10] != ' ' or value[13] != ':' or (length > 16 and value[16] != ':')):
+            return None
+        digits = value[:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]
+        if not (digits.isascii() and digits.isdigit()):
+            return None
+        return datetime.datetime(
+            int(value[:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]) if length > 10 else 0,
+            int(value[14:16]) if length > 10 else 0,
+            int(value[17:19]) if length > 16 else 0,
+        )
+
 
 class TimeValidator(Validator):
     """时间验证器"""
 
     validator_name = 'time'
     annotation = datetime.time
+    exact_type = datetime.time
     """模式：second模式数字当秒处理，time模式数字将转换时间，默认`second`"""
     mode: Literal['second', 'time']
 
@@ -1292,6 +1399,7 @@ class TimedeltaValidator(Validator):
 
     validator_name = 'timedelta'
     annotation = datetime.timedelta
+    exact_type = datetime.timedelta
 
     def validate(self, value) -> datetime.timedelta:
         if isinstance_safe(value, self.annotation):
@@ -1340,6 +1448,7 @@ class DateValidator(Validator):
     """日期验证器"""
 
     annotation = datetime.date
+    exact_type = datetime.date
 
     def validate(self, value) -> datetime.date:
         if isinstance_safe(value, self.annotation):
@@ -1370,6 +1479,7 @@ class IntEnumValidator(Validator):
     def __init__(self, enum_class: enum.EnumType, **kwargs):
         super().__init__(**kwargs)
         self.enum_class = enum_class
+        self.exact_type = enum_class
         self.values = [i.value for i in self.enum_class]
 
     def validate(self, value) -> enum.IntEnum:
@@ -1406,6 +1516,7 @@ class EnumValidator(Validator):
     def __init__(self, enum_class: enum.EnumType, use_value: bool = True, **kwargs):
         super().__init__(**kwargs)
         self.enum_class = enum_class
+        self.exact_type = enum_class
         self.use_value = use_value
         self.values = [i.value if self.use_value else i.name for i in self.enum_class]
 
@@ -1427,7 +1538,7 @@ class EnumValidator(Validator):
 
     @classmethod
     def build(cls, annotation: _T, **kwargs) -> 'EnumValidator':
-        if not issubclass_safe(annotation, enum.Enum):
+        if not is_enum_class(annotation):
             raise DataclassCustomError('building_error', '输入应为枚举类型才可构建验证器')
         return cls(annotation, **kwargs)
 
@@ -1450,6 +1561,8 @@ class UuidValidator(Validator):
     def __init__(self, version: optional[int] = None, **kwargs):
         super().__init__(**kwargs)
         self.version: optional[int] = version
+        # 限定版本时需要检查版本，不能跳过验证
+        self.exact_type = self.annotation if version is None else None
 
     def validate(self, value) -> uuid.UUID:
         try:
@@ -1479,6 +1592,11 @@ class UuidValidator(Validator):
 
 def matching_validator(annotation: _T, **kwargs) -> Validator:
     """匹配验证器"""
+    # 普通类（如int、str）既不是泛型也不是Optional，直接按类查找，无需再解析注解
+    if type(annotation) is type:
+        validator_class = MATCH_VALIDATOR.get(annotation)
+        if validator_class is not None:
+            return validator_class.build(annotation, **kwargs)
     origin_annotation = type_parser.get_origin_safe(annotation) or annotation
     # Optional原型为Union不放在上面会变成Union验证器
     if type_parser.is_optional(annotation) and annotation != Any:
@@ -1487,9 +1605,9 @@ def matching_validator(annotation: _T, **kwargs) -> Validator:
         return MATCH_VALIDATOR[origin_annotation].build(annotation, **kwargs)
     except KeyError:
         # 特殊注解
-        if issubclass_safe(annotation, enum.IntEnum):
-            return MATCH_VALIDATOR[enum.IntEnum].build(annotation, **kwargs)
-        elif issubclass_safe(annotation, enum.Enum):
+        if is_enum_class(annotation):
+            if issubclass(annotation, enum.IntEnum):
+                return MATCH_VALIDATOR[enum.IntEnum].build(annotation, **kwargs)
             return MATCH_VALIDATOR[enum.Enum].build(annotation, **kwargs)
         # typing
         elif is_typeddict(annotation):
@@ -1504,6 +1622,24 @@ def matching_validator(annotation: _T, **kwargs) -> Validator:
         return IsInstanceValidator.build(annotation, **kwargs)
 
 
+@functools.lru_cache(maxsize=512)
+def _cached_matching_validator(annotation_id: int, annotation: _T, kwargs_items: tuple) -> Validator:
+    return matching_validator(annotation, **dict(kwargs_items))
+
+
+def cached_matching_validator(annotation: _T, **kwargs) -> Validator:
+    """
+    带缓存的匹配验证器，相同注解与参数的字段共用同一个验证器（验证器构建后不再修改）。
+    以注解的id区分相等但不同的注解（如Union[int, str]与Union[str, int]的验证顺序不同），参数不可哈希时不缓存。
+    """
+    kwargs_items = tuple(sorted(kwargs.items()))
+    try:
+        hash((annotation, kwargs_items))
+    except TypeError:
+        return matching_validator(annotation, **kwargs)
+    return _cached_matching_validator(id(annotation), annotation, kwargs_items)
+
+
 def validate_iter_with_catch(
     v,
     val: Validator,
@@ -1572,10 +1708,19 @@ def check_collection_length(annotation, length: int, min_length: optional[int],
         )
 
 
+def is_exact_item_type(collection, validator: Validator) -> bool:
+    """集合内元素类型是否均与验证器的精确类型相同，相同时无需逐个验证（类型收集在C层完成）"""
+    exact_type = validator.exact_type
+    return exact_type is not None and set(map(type, collection)) <= {exact_type}
+
+
 def extract_collection(v, exception_type: str = 'collection_type', type_text: str = '集合'):
     """尝试将其作为一个可迭代可获取长度的东西，但排除字符串和映射类型"""
-    if isinstance_safe(v, (list, tuple, set, frozenset)):
+    value_type = type(v)
+    if value_type in _BUILTIN_COLLECTION_TYPES or isinstance_safe(v, (list, tuple, set, frozenset)):
         return v
+    elif value_type in _NOT_COLLECTION_TYPES:
+        raise DataclassCustomError(exception_type, f'输入应为{type_text}类型')
     elif not isinstance_safe(v, (str, bytes, bytearray, dict, Mapping)) and isinstance(v, Collection):
         return v
     raise DataclassCustomError(exception_type, f'输入应为{type_text}类型')
@@ -21,6 +21,7 @@ setup(
     license='MIT',
     packages=['fast_serializer'],
     install_requires=[],
+    extras_require={'orjson': ['orjson'], 'numpy': ['numpy']},
     # ext_modules=cythonize(extensions),
     ext_modules=cythonize('fast_serializer/*.py', language_level=3) if use_cython else [],
     classifiers=[
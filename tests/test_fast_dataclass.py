@@ -0,0 +1,19 @@
+import unittest
+
+from fast_serializer import FastDataclass, field
+
+
+class EmptyStringModel(FastDataclass):
+    name: str = field(required=True)
+
+
+class InitFromObjectConsistencyTest(unittest.TestCase):
+    """__init__与from_object对同一输入的验证结果应一致"""
+
+    def test_empty_string(self):
+        self.assertEqual(EmptyStringModel(name='').name, '')
+        self.assertEqual(EmptyStringModel.from_object({'name': ''}).name, '')
+
+
+if __name__ == '__main__':
+    unittest.main()